@@ -3,7 +3,7 @@ from typing import Optional, Dict, Any
 import pandas as pd
 from .indicators import macd, kdj, rsi, zmr, sma
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Signal:
     name: str
     value: Any
@@ -1,4 +1,5 @@
 import argparse
+from dataclasses import asdict
 from pathlib import Path
 import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -41,11 +42,13 @@ def simulate_rule(name: str, rule_fn, df: pd.DataFrame, start_date: str, days: i
     except ValueError as e:
         raise ValueError(f"Invalid start_date format: {e}") from e
 
-    window_mask = df.index >= pd.Timestamp(start_date)
-    window_index = df.index[window_mask]
-    window_dates = window_index[:days]
+    # Work positionally: the index is sorted (see load_price_csv), so the window
+    # is a contiguous run of rows starting at the first date >= start_date
+    start_pos = int(df.index.searchsorted(pd.Timestamp(start_date)))
+    window_dates = df.index[start_pos:start_pos + days]
     if len(window_dates) < days:
         raise ValueError(f"Not enough trading days after {start_date} (needed {days}, have {len(window_dates)})")
+    closes = df['close'].to_numpy(dtype=float)
 
     cash = budget
     shares = 0
@@ -53,9 +56,10 @@ def simulate_rule(name: str, rule_fn, df: pd.DataFrame, start_date: str, days: i
     target_position = 0.0  # 0..1 fraction of capital deployed
     equity_curve = []
 
-    for day in window_dates:
-        day_df = df.loc[:day]
-        close_price = float(day_df['close'].iloc[-1])
+    for offset, day in enumerate(window_dates):
+        pos = start_pos + offset
+        day_df = df.iloc[:pos + 1]
+        close_price = float(closes[pos])
         # Get signal (may be None early due to insufficient data)
         try:
             signal = rule_fn(day_df)
@@ -64,11 +68,14 @@ def simulate_rule(name: str, rule_fn, df: pd.DataFrame, start_date: str, days: i
             signal = None
         decision = signal.decision if signal else 'hold'
 
-        # Adjust target position fraction
+        # Adjust target position fraction. Rounding only drops accumulated
+        # float drift (adding 0.1 ten times is not 1.0); the clamps still
+        # apply to the stored value, so a sell from full exposure gives
+        # 1.0 - position_step
         if decision == 'buy':
-            target_position = min(1.0, target_position + position_step)
+            target_position = round(min(1.0, target_position + position_step), 12)
         elif decision == 'sell':
-            target_position = max(0.0, target_position - position_step)
+            target_position = round(max(0.0, target_position - position_step), 12)
         # hold => no change
 
         # Compute desired shares based on target position and current equity
@@ -105,11 +112,7 @@ def simulate_rule(name: str, rule_fn, df: pd.DataFrame, start_date: str, days: i
             'target_position': target_position,
         })
 
-    final_close = df.at[window_dates[-1], 'close']
-    try:
-        final_price = float(final_close)
-    except (TypeError, ValueError):
-        final_price = float(pd.to_numeric(final_close))
+    final_price = float(closes[start_pos + days - 1])
     final_equity = cash + shares * final_price
     return {
         'rule': name,
@@ -131,7 +134,7 @@ def run_single_snapshot(df: pd.DataFrame):
     print("Signals (single snapshot):")
     for name, sig in signals.items():
         print(f"{name}: decision={sig.decision} value={sig.value:.4f} rationale={sig.rationale}")
-    return {k: sig.__dict__ for k, sig in signals.items()}
+    return {k: asdict(sig) for k, sig in signals.items()}
 
 
 def run_parallel_simulation(df: pd.DataFrame, start_date: str, days: int, budget: float, max_workers: int | None):
@@ -1,4 +1,3 @@
-from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 import sys
 from datetime import datetime, timedelta
@@ -10,12 +9,16 @@ def daterange(start_date, end_date):
         yield start_date + timedelta(n)
 
 def run_tradingagents_for_dates(ticker, start_date_str, end_date_str):
+    # Imported here so the usage message never loads the LLM/graph stack
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
     start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
     end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
+    # Build the graph (LLM clients, toolkit, memories) once for the whole range
+    graph = TradingAgentsGraph(debug=True, config=config)
     for single_date in daterange(start_date, end_date):
         date_str = single_date.strftime("%Y-%m-%d")
         print(f"Running TradingAgentsGraph for {ticker} on {date_str}")
-        graph = TradingAgentsGraph(debug=True, config=config)
         final_state, final_decision = graph.propagate(ticker, date_str)
         print(f"Final decision for {ticker} on {date_str}: {final_decision}")
 
@@ -16,6 +16,7 @@ setup(
         "langchain>=0.1.0",
         "langchain-openai>=0.0.2",
         "langchain-experimental>=0.0.40",
+        "langchain-community>=0.0.10",
         "langgraph>=0.0.20",
         "numpy>=1.24.0",
         "pandas>=2.0.0",
@@ -0,0 +1,89 @@
+"""
+Tests for the incremental parse cache behind blackboard read_messages.
+"""
+
+import json
+
+import pytest
+
+from tradingagents.blackboard import storage
+
+
+def _line(message):
+    return json.dumps(message) + "\n"
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    path = tmp_path / "blackboard_logs.jsonl"
+    monkeypatch.setattr(storage, "BLACKBOARD_LOG_FILE", str(path))
+    storage._reset_parsed_log()
+    yield path
+    storage._reset_parsed_log()
+
+
+def test_appended_lines_are_picked_up(log_file):
+    storage.write_message({"id": "1", "type": "Analysis"})
+    assert [m["id"] for m in storage.read_messages()] == ["1"]
+
+    storage.write_message({"id": "2", "type": "Analysis"})
+    assert [m["id"] for m in storage.read_messages()] == ["1", "2"]
+
+
+def test_rewritten_log_on_same_inode_is_reparsed(log_file):
+    # clear_blackboard in another process followed by a recreated log can land
+    # on the same inode; once it grows past the old offset only its content differs
+    log_file.write_text(_line({"id": "old-1", "run": "a"}) + _line({"id": "old-2", "run": "a"}))
+    assert [m["id"] for m in storage.read_messages()] == ["old-1", "old-2"]
+
+    with open(log_file, "w") as f:
+        f.write(_line({"id": "new-1", "run": "b" * 10}))
+        f.write(_line({"id": "new-2", "run": "b" * 10}))
+        f.write(_line({"id": "new-3", "run": "b" * 10}))
+    assert [m["id"] for m in storage.read_messages()] == ["new-1", "new-2", "new-3"]
+
+
+def test_truncated_log_is_reparsed(log_file):
+    log_file.write_text("".join(_line({"id": str(i)}) for i in range(3)))
+    assert len(storage.read_messages()) == 3
+
+    log_file.write_text(_line({"id": "x"}))
+    assert [m["id"] for m in storage.read_messages()] == ["x"]
+
+
+def test_partial_trailing_line_waits_for_newline(log_file):
+    second = _line({"id": "2", "type": "Analysis"})
+    log_file.write_text(_line({"id": "1", "type": "Analysis"}) + second[:10])
+    assert [m["id"] for m in storage.read_messages()] == ["1"]
+
+    with open(log_file, "a") as f:
+        f.write(second[10:])
+    assert [m["id"] for m in storage.read_messages()] == ["1", "2"]
+
+
+def test_type_index_matches_linear_filter(log_file):
+    messages = [
+        {"id": "1", "type": "Analysis", "sender": {"role": "Market Analyst"}},
+        {"id": "2", "type": "Debate", "sender": {"role": "Bull Researcher"}},
+        {"id": "3"},
+        {"id": "4", "type": "Analysis", "sender": {"role": "News Analyst"}},
+    ]
+    log_file.write_text("".join(_line(m) for m in messages[:2]))
+    storage.read_messages()
+    with open(log_file, "a") as f:
+        f.write("".join(_line(m) for m in messages[2:]))
+
+    for filters in ({"type": "Analysis"}, {"type": "Debate"}, {"type": "Missing"},
+                    {"type": "Analysis", "sender.role": "News Analyst"}):
+        expected = [m for m in messages if storage._matches_filters(m, filters)]
+        assert storage.read_messages(filters) == expected
+
+
+def test_clear_blackboard_drops_cached_messages(log_file):
+    storage.write_message({"id": "1", "type": "Analysis"})
+    assert len(storage.read_messages({"type": "Analysis"})) == 1
+
+    storage.clear_blackboard()
+    assert storage.read_messages() == []
+    storage.write_message({"id": "2", "type": "Analysis"})
+    assert [m["id"] for m in storage.read_messages({"type": "Analysis"})] == ["2"]
@@ -1,23 +1,106 @@
 import argparse
 import copy
+import os
 import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional, Sequence, Union
 
-from tradingagents.graph.trading_graph import TradingAgentsGraph  # [`tradingagents.graph.trading_graph.TradingAgentsGraph`](tradingagents/graph/trading_graph.py)
 from tradingagents.default_config import DEFAULT_CONFIG  # [`DEFAULT_CONFIG`](tradingagents/default_config.py)
 import dotenv
 
 dotenv.load_dotenv()
 
+# Per-process graph used by the parallel date workers
+_WORKER_GRAPH = None
+
+# Per-day output file; the RATIONALE section is written only when there is one
+_DECISION_TEMPLATE = "TICKER: {ticker}\nDATE: {date}\nDECISION: {decision}\n"
+_DECISION_WITH_RATIONALE_TEMPLATE = _DECISION_TEMPLATE + "RATIONALE:\n{rationale}\n"
+
+
 def daterange(start: datetime, end: datetime):
     days = (end - start).days
     for n in range(days + 1):
         yield start + timedelta(n)
 
 
+def _format_decision(ticker: str, day_str: str, final_state, final_decision) -> str:
+    decision_str = final_decision if isinstance(final_decision, str) else str(final_decision)
+
+    # Optional: pull rationale if present
+    rationale = ""
+    if isinstance(final_state, dict):
+        rationale = final_state.get("final_trade_rationale") or final_state.get("portfolio_optimizer_summary") or ""
+
+    template = _DECISION_WITH_RATIONALE_TEMPLATE if rationale else _DECISION_TEMPLATE
+    return template.format(
+        ticker=ticker.upper(), date=day_str, decision=decision_str, rationale=rationale
+    )
+
+
+def _init_worker(debug: bool, config: dict, blackboard_dir: str):
+    from tradingagents.blackboard import storage
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    # Each worker gets its own blackboard log. A shared one would be cleared
+    # by every worker's graph setup, and since blackboard reads filter by
+    # ticker only, a worker could read reports written for later dates.
+    os.makedirs(blackboard_dir, exist_ok=True)
+    storage.BLACKBOARD_LOG_FILE = os.path.join(blackboard_dir, f"blackboard_{os.getpid()}.jsonl")
+
+    global _WORKER_GRAPH
+    _WORKER_GRAPH = TradingAgentsGraph(debug=debug, config=config)
+
+
+def _day_worker(ticker: str, day_str: str, fpath: str) -> str:
+    final_state, final_decision = _WORKER_GRAPH.propagate(ticker, day_str)
+    Path(fpath).write_text(_format_decision(ticker, day_str, final_state, final_decision), encoding="utf-8")
+
+    reset_fn = getattr(_WORKER_GRAPH, "reset_daily_state", None)
+    if callable(reset_fn):
+        reset_fn()
+    return fpath
+
+
+def _run_range_parallel(jobs, out_path, debug, base_config, workers, fail_fast, show_trace):
+    """Run independent (ticker, day) jobs across worker processes, each with its own graph.
+
+    All jobs are submitted up front and reaped as they finish, so one slow
+    ticker or date does not hold up the rest of the universe. Each worker
+    writes its own blackboard log under <outdir>/blackboard, and jobs are
+    taken in submission order, so a worker only sees reports from its own
+    earlier days. Jobs still share config/portfolio.json through the
+    execution tools, so only use this for backtests where runs do not depend
+    on each other's trades.
+    """
+    blackboard_dir = str(out_path / "blackboard")
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(debug, base_config, blackboard_dir)
+    ) as executor:
+        futures = {}
+        for ticker, day_str in jobs:
+            print(f"🚀 {ticker.upper()} {day_str} starting")
+            fpath = out_path / f"{ticker.upper()}_{day_str}.txt"
+            futures[executor.submit(_day_worker, ticker, day_str, str(fpath))] = (ticker, day_str)
+
+        for future in as_completed(futures):
+            ticker, day_str = futures[future]
+            try:
+                print(f"✅ Saved -> {future.result()}")
+            except Exception as e:
+                print(f"❌ Error {ticker.upper()} {day_str}: {e}")
+                if show_trace:
+                    traceback.print_exception(type(e), e, e.__traceback__)
+                if fail_fast:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+
+
 def run_range(
-    ticker: str,
+    ticker: Union[str, Sequence[str]],
     start_date: str,
     end_date: str,
     outdir: str = "results",
@@ -25,6 +108,8 @@ def run_range(
     deep_copy_config: bool = True,
     fail_fast: bool = False,
     show_trace: bool = False,
+    workers: int = 1,
+    llm_cache: Optional[str] = None,
 ):
     # Validate dates
     try:
@@ -37,17 +122,38 @@ def run_range(
 
     out_path = Path(outdir)
     out_path.mkdir(parents=True, exist_ok=True)
+    # One directory read up front instead of a stat() per date
+    with os.scandir(out_path) as it:
+        existing = {entry.name for entry in it}
 
     base_config = copy.deepcopy(DEFAULT_CONFIG) if deep_copy_config else DEFAULT_CONFIG.copy()
+    if llm_cache:
+        # Re-running a range answers every unchanged prompt from this file
+        base_config["llm_cache_path"] = llm_cache
+
+    # Every (ticker, day) pair still to run; a single ticker is a universe of one
+    tickers = [ticker] if isinstance(ticker, str) else list(ticker)
+    days = [current.strftime("%Y-%m-%d") for current in daterange(start_dt, end_dt)]
+    jobs = []
+    for symbol in tickers:
+        for day_str in days:
+            if f"{symbol.upper()}_{day_str}.txt" in existing:
+                print(f"⏭️  Skip {symbol.upper()} {day_str} (exists)")
+                continue
+            jobs.append((symbol, day_str))
+
+    if workers > 1:
+        _run_range_parallel(jobs, out_path, debug, base_config, workers, fail_fast, show_trace)
+        print("🏁 Completed range.")
+        return
+
+    # Imported here so --help and argument errors never load the LLM/graph stack
+    from tradingagents.graph.trading_graph import TradingAgentsGraph  # [`tradingagents.graph.trading_graph.TradingAgentsGraph`](tradingagents/graph/trading_graph.py)
+
     graph = TradingAgentsGraph(debug=debug, config=base_config)
 
-    for current in daterange(start_dt, end_dt):
-        day_str = current.strftime("%Y-%m-%d")
-        fname = f"{ticker.upper()}_{day_str}.txt"
-        fpath = out_path / fname
-        if fpath.exists():
-            print(f"⏭️  Skip {day_str} (exists)")
-            continue
+    for ticker, day_str in jobs:
+        fpath = out_path / f"{ticker.upper()}_{day_str}.txt"
 
         print(f"🚀 {ticker.upper()} {day_str} starting")
         try:
@@ -56,29 +162,14 @@ def run_range(
             print("🛑 Interrupted by user.")
             break
         except Exception as e:
-            print(f"❌ Error {day_str}: {e}")
+            print(f"❌ Error {ticker.upper()} {day_str}: {e}")
             if show_trace:
                 traceback.print_exc()
             if fail_fast:
                 raise
             continue
 
-        decision_str = final_decision if isinstance(final_decision, str) else str(final_decision)
-
-        # Optional: pull rationale if present
-        rationale = ""
-        if isinstance(final_state, dict):
-            rationale = final_state.get("final_trade_rationale") or final_state.get("portfolio_optimizer_summary") or ""
-
-        content_lines = [
-            f"TICKER: {ticker.upper()}",
-            f"DATE: {day_str}",
-            f"DECISION: {decision_str}",
-        ]
-        if rationale:
-            content_lines.append("RATIONALE:")
-            content_lines.append(rationale)
-        file_text = "\n".join(content_lines) + "\n"
+        file_text = _format_decision(ticker, day_str, final_state, final_decision)
 
         try:
             fpath.write_text(file_text, encoding="utf-8")
@@ -96,9 +187,9 @@ def run_range(
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Run trading agents over a date range; persist decisions as TICKER_DATE.txt."
+        description="Run trading agents over a date range for one or more tickers; persist decisions as TICKER_DATE.txt."
     )
-    parser.add_argument("ticker", help="Ticker symbol (e.g. AAPL)")
+    parser.add_argument("tickers", nargs="+", help="One or more ticker symbols (e.g. AAPL MSFT)")
     parser.add_argument("start_date", help="Start date YYYY-MM-DD")
     parser.add_argument("end_date", help="End date YYYY-MM-DD")
     parser.add_argument("--outdir", default="evalRes", help="Output directory (default: evalRes)")
@@ -106,10 +197,21 @@ def main():
     parser.add_argument("--shallow-config", action="store_true", help="Use shallow copy of DEFAULT_CONFIG")
     parser.add_argument("--fail-fast", action="store_true", help="Abort on first error")
     parser.add_argument("--trace", action="store_true", help="Show full tracebacks on errors")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Run ticker/date jobs in this many worker processes (default 1: sequential). Only for independent days.",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        metavar="PATH",
+        help="SQLite file caching LLM responses across runs (default: TRADINGAGENTS_LLM_CACHE, else disabled)",
+    )
     args = parser.parse_args()
 
     run_range(
-        args.ticker,
+        args.tickers,
         args.start_date,
         args.end_date,
         args.outdir,
@@ -117,6 +219,8 @@ def main():
         deep_copy_config=not args.shallow_config,
         fail_fast=args.fail_fast,
         show_trace=args.trace,
+        workers=args.workers,
+        llm_cache=args.llm_cache,
     )
 
 
@@ -1,32 +1,16 @@
-from .utils.agent_utils import Toolkit, create_msg_delete
-from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
-from .utils.memory import FinancialSituationMemory
+import functools
+import importlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
-from .analysts.fundamentals_analyst import create_fundamentals_analyst
-from .analysts.market_analyst import create_market_analyst
-from .analysts.news_analyst import create_news_analyst
-from .analysts.social_media_analyst import create_social_media_analyst
-from .analysts.macroeconomic_analyst import create_macroeconomic_analyst
+# Submodules are imported on first attribute access (PEP 562) so that e.g.
+# `from tradingagents.agents import Toolkit` does not pull in every agent and
+# its LLM/langchain dependencies. The name -> submodule map is generated by
+# _gen_registry.py from the create_* definitions.
+from ._lazy_registry import _LAZY
 
-from .researchers.bear_researcher import create_bear_researcher
-from .researchers.bull_researcher import create_bull_researcher
-
-# Cross Examination Agents
-from .researchers.bear_researcher_crossex import create_bear_crossex_researcher
-from .researchers.bull_researcher_crossex import create_bull_crossex_researcher
-
-from .risk_mgmt.aggresive_debator import create_risky_debator
-from .risk_mgmt.conservative_debator import create_safe_debator
-from .risk_mgmt.neutral_debator import create_neutral_debator
-
-from .managers.research_manager import create_research_manager
-from .managers.risk_manager import create_risk_manager
-from .managers.portfolio_optimizer import create_portfolio_optimizer
-from .managers.quantoptions_manager import create_quant_options_manager
-
-from .trader.trader import create_trader
-
-__all__ = [
+__all__ = tuple(sorted(sys.intern(name) for name in {
     "FinancialSituationMemory",
     "Toolkit",
     "AgentState",
@@ -50,4 +34,138 @@ __all__ = [
     "create_portfolio_optimizer",
     "create_quant_options_manager",
     "create_trader",
-]
+    "analyst_factories",
+    "researcher_factories",
+    "risk_factories",
+    "manager_factories",
+}))
+
+# Factory groups exposed as SimpleNamespaces, keyed the way graph setup names
+# the nodes. The group names avoid the analysts/researchers/managers
+# subpackages, which the import system binds on this package.
+_GROUPS = {
+    "analyst_factories": (
+        ("market", "create_market_analyst"),
+        ("macroeconomic", "create_macroeconomic_analyst"),
+        ("social", "create_social_media_analyst"),
+        ("news", "create_news_analyst"),
+        ("fundamentals", "create_fundamentals_analyst"),
+    ),
+    "researcher_factories": (
+        ("bull", "create_bull_researcher"),
+        ("bear", "create_bear_researcher"),
+        ("bull_crossex", "create_bull_crossex_researcher"),
+        ("bear_crossex", "create_bear_crossex_researcher"),
+    ),
+    "risk_factories": (
+        ("risky", "create_risky_debator"),
+        ("safe", "create_safe_debator"),
+        ("neutral", "create_neutral_debator"),
+    ),
+    "manager_factories": (
+        ("research", "create_research_manager"),
+        ("risk", "create_risk_manager"),
+        ("portfolio_optimizer", "create_portfolio_optimizer"),
+        ("quant_options", "create_quant_options_manager"),
+    ),
+}
+
+
+# Factories wrapped by _memo, so clear_factory_cache() can reach their caches
+_MEMOIZED = {}
+
+
+class _ByIdentity:
+    """Hashes an argument by identity; LLM clients and memories are not hashable."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return isinstance(other, _ByIdentity) and other.obj is self.obj
+
+
+def _freeze(kwargs):
+    return frozenset((key, _ByIdentity(value)) for key, value in kwargs.items())
+
+
+def _memo(fn):
+    """Return the same node callable for repeated calls with the same llm/memory/toolkit."""
+
+    @functools.lru_cache(maxsize=32)
+    def cached(args, kwargs):
+        return fn(*(arg.obj for arg in args), **{key: value.obj for key, value in kwargs})
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return cached(tuple(_ByIdentity(arg) for arg in args), _freeze(kwargs))
+
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+def clear_factory_cache():
+    """Drop memoized node callables (and the llm/memory objects they keep alive)."""
+    for factory in _MEMOIZED.values():
+        factory.cache_clear()
+
+
+def _resolve(name):
+    g = globals()
+    return g[name] if name in g else __getattr__(name)
+
+
+def __getattr__(name):
+    if name in _GROUPS:
+        obj = SimpleNamespace(**{key: _resolve(factory) for key, factory in _GROUPS[name]})
+        globals()[name] = obj
+        return obj
+    mod_path = _LAZY.get(name)
+    if mod_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(mod_path, __name__), name)
+    if name.startswith("create_"):
+        obj = _MEMOIZED[name] = _memo(obj)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_GROUPS))
+
+
+def _try_import(mod_path):
+    try:
+        importlib.import_module(mod_path, __name__)
+    except Exception:
+        # Includes the module-lock deadlock (a RuntimeError) two threads can
+        # hit on interdependent modules; the sequential retry sorts it out
+        return mod_path
+    return None
+
+
+def _warm(names, max_workers):
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        mod_paths = {_LAZY[name] for name in names}
+        failed = [p for p in executor.map(_try_import, mod_paths) if p]
+    for mod_path in failed:
+        importlib.import_module(mod_path, __name__)
+    for name in names:
+        _resolve(name)
+
+
+def warmup(max_workers=8):
+    """Import every agent submodule up front, overlapping the file reads across threads.
+
+    Modules that fail under concurrent import (e.g. a circular import hit while
+    another thread holds the module lock) are retried sequentially so genuine
+    errors still surface.
+    """
+    _warm(_LAZY, max_workers)
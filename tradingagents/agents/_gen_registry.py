@@ -0,0 +1,83 @@
+"""Regenerate _lazy_registry.py from the agent submodules.
+
+Run after adding or renaming an agent factory:
+
+    python -m tradingagents.agents._gen_registry
+
+Every top-level ``def create_*`` under this package is collected by parsing
+the source (nothing is imported), together with the non-factory exports
+listed in _EXTRA.
+"""
+
+import ast
+import os
+
+_PKG_DIR = os.path.dirname(os.path.abspath(__file__))
+_OUTPUT = os.path.join(_PKG_DIR, "_lazy_registry.py")
+
+# Exports that are not create_* factories
+_EXTRA = (
+    ("utils.agent_utils", "Toolkit"),
+    ("utils.agent_states", "AgentState"),
+    ("utils.agent_states", "InvestDebateState"),
+    ("utils.agent_states", "RiskDebateState"),
+    ("utils.memory", "FinancialSituationMemory"),
+)
+
+_HEADER = '''# Generated by tradingagents/agents/_gen_registry.py -- do not edit by hand.
+#
+# Exported name -> submodule that defines it, relative to tradingagents.agents.
+# The map is a literal, so it is already persisted in this module's .pyc and
+# there is nothing to rebuild per process.
+'''
+
+
+def scan_factories(pkg_dir=_PKG_DIR):
+    """Return {name: relative module path} for every top-level create_* function."""
+    found = {}
+    for root, dirs, files in os.walk(pkg_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(("_", ".")))
+        if root == pkg_dir:
+            continue
+        for filename in sorted(files):
+            if not filename.endswith(".py") or filename.startswith("_"):
+                continue
+            path = os.path.join(root, filename)
+            module = os.path.relpath(path, pkg_dir)[:-3].replace(os.sep, ".")
+            with open(path, "r", encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=path)
+            for node in tree.body:
+                if isinstance(node, ast.FunctionDef) and node.name.startswith("create_"):
+                    if node.name in found:
+                        raise ValueError(
+                            f"{node.name} is defined in both {found[node.name]} and .{module}"
+                        )
+                    found[node.name] = f".{module}"
+    return found
+
+
+def build_registry(pkg_dir=_PKG_DIR):
+    registry = scan_factories(pkg_dir)
+    for module, name in _EXTRA:
+        registry[name] = f".{module}"
+    return dict(sorted(registry.items()))
+
+
+def render(registry):
+    lines = [_HEADER, "_LAZY = {"]
+    lines += [f'    "{name}": "{module}",' for name, module in registry.items()]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    source = render(build_registry())
+    tmp_path = f"{_OUTPUT}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(source)
+    os.replace(tmp_path, _OUTPUT)
+    print(f"Wrote {_OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
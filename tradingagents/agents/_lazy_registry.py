@@ -0,0 +1,40 @@
+# Generated by tradingagents/agents/_gen_registry.py -- do not edit by hand.
+#
+# Exported name -> submodule that defines it, relative to tradingagents.agents.
+# The map is a literal, so it is already persisted in this module's .pyc and
+# there is nothing to rebuild per process.
+
+_LAZY = {
+    "AgentState": ".utils.agent_states",
+    "FinancialSituationMemory": ".utils.memory",
+    "InvestDebateState": ".utils.agent_states",
+    "RiskDebateState": ".utils.agent_states",
+    "Toolkit": ".utils.agent_utils",
+    "create_bear_crossex_researcher": ".researchers.bear_researcher_crossex",
+    "create_bear_researcher": ".researchers.bear_researcher",
+    "create_bear_researcher_ans": ".researchers.bear_researcher_ans",
+    "create_bear_researcher_ask": ".researchers.bear_researcher_ask",
+    "create_bull_crossex_researcher": ".researchers.bull_researcher_crossex",
+    "create_bull_researcher": ".researchers.bull_researcher",
+    "create_bull_researcher_ans": ".researchers.bull_researcher_ans",
+    "create_bull_researcher_ask": ".researchers.bull_researcher_ask",
+    "create_fundamentals_analyst": ".analysts.fundamentals_analyst",
+    "create_macroeconomic_analyst": ".analysts.macroeconomic_analyst",
+    "create_market_analyst": ".analysts.market_analyst",
+    "create_msg_delete": ".utils.agent_utils",
+    "create_neutral_debator": ".risk_mgmt.neutral_debator",
+    "create_news_analyst": ".analysts.news_analyst",
+    "create_options_trading_agent": ".managers.options_manager",
+    "create_portfolio_optimizer": ".managers.portfolio_optimizer",
+    "create_quant_options_manager": ".managers.quantoptions_manager",
+    "create_research_manager": ".managers.research_manager",
+    "create_risk_manager": ".managers.risk_manager",
+    "create_risky_debator": ".risk_mgmt.aggresive_debator",
+    "create_risky_debator_ans": ".risk_mgmt.aggresive_debator_ans",
+    "create_risky_debator_ask": ".risk_mgmt.aggresive_debator_ask",
+    "create_safe_debator": ".risk_mgmt.conservative_debator",
+    "create_safe_debator_ans": ".risk_mgmt.conservative_debator_ans",
+    "create_safe_debator_ask": ".risk_mgmt.conservative_debator_ask",
+    "create_social_media_analyst": ".analysts.social_media_analyst",
+    "create_trader": ".trader.trader",
+}
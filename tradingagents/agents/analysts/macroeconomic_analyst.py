@@ -1,40 +1,14 @@
+import functools
+import logging
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
 from tradingagents.blackboard.utils import create_agent_blackboard
 
+logger = logging.getLogger(__name__)
 
-def create_macroeconomic_analyst(llm, toolkit):
-
-    def macroeconomic_analyst_node(state):
-        current_date = state["trade_date"]
-        ticker = state["company_of_interest"]
-        company_name = state["company_of_interest"]
-
-        # Blackboard integration
-        blackboard_agent = create_agent_blackboard("MEA_001", "MacroeconomicAnalyst")
-        # Read recent macroeconomic analysis reports for context
-        recent_analyses = blackboard_agent.get_analysis_reports(ticker=ticker)
-        blackboard_context = ""
-        if recent_analyses:
-            blackboard_context += "\n\nRecent Macroeconomic Analysis Reports on Blackboard:\n"
-            for analysis in recent_analyses[-3:]:
-                content = analysis.get('content', {})
-                blackboard_context += f"- {analysis['sender'].get('role', 'Unknown')}: {content.get('recommendation', 'N/A')} (Confidence: {content.get('confidence', 'N/A')})\n"
-
-        if toolkit.config["online_tools"]:
-            tools = [
-                toolkit.get_YFin_data_online,
-                toolkit.get_stockstats_indicators_report_online,
-            ]
-        else:
-            tools = [
-                toolkit.get_YFin_data,
-                toolkit.get_stockstats_indicators_report,
-            ]
-
-        system_message = (
-            """You are a Macroeconomic Analyst specializing in analyzing how economic factors, monetary policy, and global economic conditions impact financial markets and individual securities. Your role is to provide comprehensive macroeconomic analysis that helps traders understand the broader economic context affecting their trading decisions.
+# Static instructions; the per-call blackboard context is a template variable
+_SYSTEM_MESSAGE = """You are a Macroeconomic Analyst specializing in analyzing how economic factors, monetary policy, and global economic conditions impact financial markets and individual securities. Your role is to provide comprehensive macroeconomic analysis that helps traders understand the broader economic context affecting their trading decisions.
 
 ## Your Analysis Focus Areas:
 
@@ -136,89 +110,125 @@ When analyzing market data, focus on indicators that reflect macroeconomic trend
 }
 
 Make sure to append a Markdown table at the end of the report to organize key macroeconomic insights and their trading implications."""
-            + f"\n\nBlackboard Context:{blackboard_context}"
-        )
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful AI assistant, collaborating with other assistants."
-                    " Use the provided tools to progress towards answering the question."
-                    " If you are unable to fully answer, that's OK; another assistant with different tools"
-                    " will help where you left off. Execute what you can to make progress."
-                    " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
-                    " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
-                    " You have access to the following tools: {tool_names}.\n{system_message}"
-                    "For your reference, the current date is {current_date}. The company we want to look at is {ticker}"
-                ),
-                MessagesPlaceholder(variable_name="messages"),
-            ]
-        )
-
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
-        prompt = prompt.partial(current_date=current_date)
-        prompt = prompt.partial(ticker=ticker)
-
-        # Execute the analysis
-        messages = state["messages"]
-        response = llm.invoke(prompt.format_messages(messages=messages))
+
+# Parsed once at import; each factory only binds its tool names. The per-call
+# blackboard, date and ticker stay at the end so the long static prefix can be
+# reused by providers with prefix caching.
+_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "You are a helpful AI assistant, collaborating with other assistants."
+            " Use the provided tools to progress towards answering the question."
+            " If you are unable to fully answer, that's OK; another assistant with different tools"
+            " will help where you left off. Execute what you can to make progress."
+            " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+            " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
+            " You have access to the following tools: {tool_names}.\n{system_message}\n\nBlackboard Context:{blackboard_context}\n\n"
+            "For your reference, the current date is {current_date}. The company we want to look at is {ticker}"
+        ),
+        MessagesPlaceholder(variable_name="messages"),
+    ]
+).partial(system_message=_SYSTEM_MESSAGE)
+
+
+def _macroeconomic_tools(toolkit):
+    if toolkit.config["online_tools"]:
+        return [
+            toolkit.get_YFin_data_online,
+            toolkit.get_stockstats_indicators_report_online,
+        ]
+    return [
+        toolkit.get_YFin_data,
+        toolkit.get_stockstats_indicators_report,
+    ]
+
+
+def macroeconomic_analyst_node(chain, blackboard_agent, state):
+    current_date = state["trade_date"]
+    ticker = state["company_of_interest"]
+
+    # Read recent macroeconomic analysis reports for context
+    recent_analyses = blackboard_agent.get_analysis_reports(ticker=ticker)
+    blackboard_context = ""
+    if recent_analyses:
+        parts = ["\n\nRecent Macroeconomic Analysis Reports on Blackboard:\n"]
+        for analysis in recent_analyses[-3:]:
+            content = analysis.get('content', {})
+            parts.append(f"- {analysis['sender'].get('role', 'Unknown')}: {content.get('recommendation', 'N/A')} (Confidence: {content.get('confidence', 'N/A')})\n")
+        blackboard_context = "".join(parts)
+
+    # Execute the analysis
+    response = chain.invoke({
+        "messages": state["messages"],
+        "blackboard_context": blackboard_context,
+        "current_date": current_date,
+        "ticker": ticker,
+    })
+    
+    # Parse the response
+    try:
+        # Extract the content from the response
+        content = response.content
         
-        # Parse the response
-        try:
-            # Extract the content from the response
-            content = response.content
+        # Try to parse as JSON
+        if "{" in content and "}" in content:
+            start = content.find("{")
+            end = content.rfind("}") + 1
+            json_str = content[start:end]
+            
+            # Parse the JSON response
+            parsed_response = json.loads(json_str)
+            
+            # Post analysis report to blackboard
+            blackboard_agent.post_analysis_report(
+                ticker=ticker,
+                analysis=parsed_response,
+                confidence=str(parsed_response.get("confidence", 50))
+            )
             
-            # Try to parse as JSON
-            if "{" in content and "}" in content:
-                start = content.find("{")
-                end = content.rfind("}") + 1
-                json_str = content[start:end]
-                
-                # Parse the JSON response
-                parsed_response = json.loads(json_str)
-                
-                # Post analysis report to blackboard
-                blackboard_agent.post_analysis_report(
-                    ticker=ticker,
-                    analysis=parsed_response,
-                    confidence=str(parsed_response.get("confidence", 50))
-                )
-                
-                # Return the parsed response
-                return {
-                    "messages": [response],
-                    "macroeconomic_analysis": parsed_response
-                }
-            else:
-                # Fallback if JSON parsing fails
-                fallback_response = {
-                    "prefix": "",
-                    "content": content,
-                    "economic_variables": [],
-                    "macro_risks": [],
-                    "policy_implications": [],
-                    "confidence": 50,
-                    "decision": 50,
-                    "table": "| Factor | Status | Impact |\n|--------|--------|--------|\n| Analysis | Complete | See content above |"
-                }
-                
-                # Post to blackboard
-                blackboard_agent.post_analysis_report(
-                    ticker=ticker,
-                    analysis=fallback_response,
-                    confidence="50"
-                )
-                
-                return {
-                    "messages": [response],
-                    "macroeconomic_analysis": fallback_response
-                }
-                
-        except json.JSONDecodeError as e:
-            print(f"JSON parsing error in macroeconomic analyst: {e}")
-            # Return the raw response if JSON parsing fails
-            return {"messages": [response]}
-
-    return macroeconomic_analyst_node 
\ No newline at end of file
+            # Return the parsed response
+            return {
+                "messages": [response],
+                "macroeconomic_analysis": parsed_response
+            }
+        else:
+            # Fallback if JSON parsing fails
+            fallback_response = {
+                "prefix": "",
+                "content": content,
+                "economic_variables": [],
+                "macro_risks": [],
+                "policy_implications": [],
+                "confidence": 50,
+                "decision": 50,
+                "table": "| Factor | Status | Impact |\n|--------|--------|--------|\n| Analysis | Complete | See content above |"
+            }
+            
+            # Post to blackboard
+            blackboard_agent.post_analysis_report(
+                ticker=ticker,
+                analysis=fallback_response,
+                confidence="50"
+            )
+            
+            return {
+                "messages": [response],
+                "macroeconomic_analysis": fallback_response
+            }
+            
+    except json.JSONDecodeError as e:
+        logger.warning("JSON parsing error in macroeconomic analyst: %s", e)
+        # Return the raw response if JSON parsing fails
+        return {"messages": [response]}
+
+
+def create_macroeconomic_analyst(llm, toolkit):
+    # The tools are only named in the prompt (the model is not bound to them),
+    # so the prompt and chain are composed once here instead of per call
+    tools = _macroeconomic_tools(toolkit)
+    prompt = _PROMPT.partial(tool_names=", ".join(tool.name for tool in tools))
+    # Blackboard integration; create_agent_blackboard returns the memoized
+    # handle for this role, bound here so the node does not look it up per call
+    blackboard_agent = create_agent_blackboard("MEA_001", "MacroeconomicAnalyst")
+    return functools.partial(macroeconomic_analyst_node, prompt | llm, blackboard_agent)
\ No newline at end of file
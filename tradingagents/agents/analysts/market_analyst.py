@@ -1,40 +1,14 @@
+import functools
 from langchain_core.prompts import MessagesPlaceholder, ChatPromptTemplate
 import time
 import json
 from tradingagents.blackboard.utils import create_agent_blackboard
+from tradingagents.agents.utils.debate_utils import extract_recommendation
 
-
-def create_market_analyst(llm, toolkit):
-
-    def market_analyst_node(state):
-        current_date = state["trade_date"]
-        ticker = state["company_of_interest"]
-        company_name = state["company_of_interest"]
-
-        # Blackboard integration
-        blackboard_agent = create_agent_blackboard("MA_001", "MarketAnalyst")
-        # Read recent market analysis reports for context
-        recent_analyses = blackboard_agent.get_analysis_reports(ticker=ticker)
-        blackboard_context = ""
-        if recent_analyses:
-            blackboard_context += "\n\nRecent Market Analysis Reports on Blackboard:\n"
-            for analysis in recent_analyses[-3:]:
-                content = analysis.get('content', {})
-                blackboard_context += f"- {analysis['sender'].get('role', 'Unknown')}: {content.get('recommendation', 'N/A')} (Confidence: {content.get('confidence', 'N/A')})\n"
-
-        if toolkit.config["online_tools"]:
-            tools = [
-                toolkit.get_YFin_data_online,
-                toolkit.get_stockstats_indicators_report_online,
-            ]
-        else:
-            tools = [
-                toolkit.get_YFin_data,
-                toolkit.get_stockstats_indicators_report,
-            ]
-
-        system_message = (
-            """You are a trading assistant tasked with analyzing financial markets. Your role is to select the **most relevant indicators** for a given market condition or trading strategy from the following comprehensive list. The goal is to choose up to **8 indicators** that provide complementary insights without redundancy. Categories and each category's indicators are:
+# Static instructions with the full indicator catalog; the per-call
+# blackboard context is a template variable
+_SYSTEM_MESSAGE = (
+    """You are a trading assistant tasked with analyzing financial markets. Your role is to select the **most relevant indicators** for a given market condition or trading strategy from the following comprehensive list. The goal is to choose up to **8 indicators** that provide complementary insights without redundancy. Categories and each category's indicators are:
 
 Basic Price Analysis:
 - delta: Price change between periods
@@ -119,12 +93,11 @@ Advanced Analysis:
 - coppock: Coppock Curve: Long-term momentum indicator for major trend changes
 
 - Select indicators that provide diverse and complementary information. Avoid redundancy (e.g., do not select both rsi and stochrsi unless specifically needed). Also briefly explain why they are suitable for the given market context. When you tool call, please use the exact name of the indicators provided above as they are defined parameters, otherwise your call will fail. Please make sure to call get_YFin_data first to retrieve the CSV that is needed to generate indicators. Write a very detailed and nuanced report of the trends you observe. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."""
-            + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
-            + f"\n\nBlackboard Context:{blackboard_context}"
-        )
+    + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
+    + """ The indicator reports are independent of each other, so once the price data is available request all of your selected indicators in a single response; they are executed in parallel."""
+)
 
-        json_format = (" Respond ONLY with a valid JSON object in the following format:"
-"""
+_JSON_FORMAT = """
 {   
     "prefix": "...", // The prefix of the response. If previous messages contain FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**, make sure to include it in your response too. Else, leave it empty.
     "content": "...", // Overall writeup of the response
@@ -136,74 +109,101 @@ Advanced Analysis:
     "decision": "", // the decision of the response as a scale from 1 to 100, where 1 is do not trade and 100 is trade
     "table": "" // A Markdown table with key points in the report, organized and easy to read
 }
-""")
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful AI assistant, collaborating with other assistants."
-                    " Use the provided tools to progress towards answering the question."
-                    " If you are unable to fully answer, that's OK; another assistant with different tools"
-                    " will help where you left off. Execute what you can to make progress."
-                    " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
-                    " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
-                    " You have access to the following tools: {tool_names}.\n{system_message}"
-                    "For your reference, the current date is {current_date}. The company we want to look at is {ticker}"
-                    "The JSON format for the response is as follows:\n{json_format}"
-                ),
-                MessagesPlaceholder(variable_name="messages"),
-            ]
-        )
-
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
-        prompt = prompt.partial(current_date=current_date)
-        prompt = prompt.partial(ticker=ticker)
-        prompt = prompt.partial(json_format=json_format)
-
-        chain = prompt | llm.bind_tools(tools)
-
-        result = chain.invoke(state["messages"])
-
-        report = ""
-
-        print(result.content)
-        
-        if len(result.tool_calls) == 0:
-            report = result.content.encode('utf-8', errors='replace').decode('utf-8') if result.content else ""
-
-        # Escape the result content to handle Unicode characters
-        if hasattr(result, 'content') and result.content:
-            result.content = result.content.encode('utf-8', errors='replace').decode('utf-8')
-       
-        # Post the generated report to the blackboard
-        # Extract recommendation and confidence heuristically
-        recommendation = "Neutral"
-        confidence = "Medium"
-        if "BUY" in report.upper():
-            recommendation = "Bullish"
-        elif "SELL" in report.upper():
-            recommendation = "Bearish"
-        if "HIGH" in report.upper() and "CONFIDENCE" in report.upper():
-            confidence = "High"
-        elif "LOW" in report.upper() and "CONFIDENCE" in report.upper():
-            confidence = "Low"
-        analysis_content = {
-            "ticker": ticker,
-            "recommendation": recommendation,
-            "confidence": confidence,
-            "analysis": report
-        }
-        blackboard_agent.post_analysis_report(
-            ticker=ticker,
-            analysis=analysis_content,
-            confidence=confidence
-        )
-
-        return {
-            "messages": [result],
-            "market_report": report,
-        }
-
-    return market_analyst_node
+"""
+
+# Parsed once at import; each factory only binds its tool names. The per-call
+# blackboard, date and ticker come last so the static prefix stays shared.
+_PROMPT = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        "You are a helpful AI assistant, collaborating with other assistants."
+        " Use the provided tools to progress towards answering the question."
+        " If you are unable to fully answer, that's OK; another assistant with different tools"
+        " will help where you left off. Execute what you can to make progress."
+        " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+        " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
+        " You have access to the following tools: {tool_names}.\n\n{system_message}\n\n"
+        "Respond ONLY with a valid JSON object in the following format: {json_format}\n\n"
+        "Blackboard Context:{blackboard_context}\n\n"
+        "For your reference, the current date is {current_date}. The company we want to look at is {ticker}.",
+    ),
+    MessagesPlaceholder(variable_name="messages"),
+]).partial(system_message=_SYSTEM_MESSAGE, json_format=_JSON_FORMAT)
+
+
+def _market_tools(toolkit):
+    if toolkit.config["online_tools"]:
+        return [
+            toolkit.get_YFin_data_online,
+            toolkit.get_stockstats_indicators_report_online,
+        ]
+    return [
+        toolkit.get_YFin_data,
+        toolkit.get_stockstats_indicators_report,
+    ]
+
+
+def market_analyst_node(chain, blackboard_agent, state):
+    current_date = state["trade_date"]
+    ticker = state["company_of_interest"]
+
+    # Read recent market analysis reports for context
+    recent_analyses = blackboard_agent.get_analysis_reports(ticker=ticker)
+    blackboard_context = ""
+    if recent_analyses:
+        parts = ["\n\nRecent Market Analysis Reports on Blackboard:\n"]
+        for analysis in recent_analyses[-3:]:
+            content = analysis.get('content', {})
+            parts.append(f"- {analysis['sender'].get('role', 'Unknown')}: {content.get('recommendation', 'N/A')} (Confidence: {content.get('confidence', 'N/A')})\n")
+        blackboard_context = "".join(parts)
+
+    result = chain.invoke({
+        "messages": state["messages"],
+        "blackboard_context": blackboard_context,
+        "current_date": current_date,
+        "ticker": ticker,
+    })
+
+    # Escape the result content to handle Unicode characters; the report is
+    # the same sanitized text, so the content is only re-encoded once
+    if hasattr(result, 'content') and result.content:
+        result.content = result.content.encode('utf-8', errors='replace').decode('utf-8')
+
+    print(result.content)
+
+    report = ""
+
+    if len(result.tool_calls) == 0:
+        report = result.content or ""
+   
+    # Post the generated report to the blackboard
+    # Extract recommendation and confidence heuristically
+    recommendation, confidence = extract_recommendation(report)
+    analysis_content = {
+        "ticker": ticker,
+        "recommendation": recommendation,
+        "confidence": confidence,
+        "analysis": report
+    }
+    blackboard_agent.post_analysis_report(
+        ticker=ticker,
+        analysis=analysis_content,
+        confidence=confidence
+    )
+
+    return {
+        "messages": [result],
+        "market_report": report,
+    }
+
+
+def create_market_analyst(llm, toolkit):
+    # The tool set is fixed by the config, so the prompt and the tool-bound
+    # chain are composed once here instead of on every node call
+    tools = _market_tools(toolkit)
+    prompt = _PROMPT.partial(tool_names=", ".join(tool.name for tool in tools))
+    chain = prompt | llm.bind_tools(tools)
+    # Blackboard integration; create_agent_blackboard returns the memoized
+    # handle for this role, bound here so the node does not look it up per call
+    blackboard_agent = create_agent_blackboard("MA_001", "MarketAnalyst")
+    return functools.partial(market_analyst_node, chain, blackboard_agent)
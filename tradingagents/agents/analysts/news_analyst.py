@@ -1,41 +1,19 @@
 # -*- coding: utf-8 -*-
+import functools
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
 from tradingagents.blackboard.utils import create_agent_blackboard
+from tradingagents.agents.utils.debate_utils import extract_recommendation
 
+# Static instructions; the per-call blackboard context is a template variable
+_SYSTEM_MESSAGE = (
+    "You are a news researcher tasked with analyzing recent news and trends over the past week. Please write a comprehensive report of the current state of the world that is relevant for trading and macroeconomics. Look at news from EODHD, and finnhub to be comprehensive. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
+    + " Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."
+    + " The news tools are independent of each other, so request every tool you need in a single response; they are executed in parallel."
+)
 
-def create_news_analyst(llm, toolkit):
-    def news_analyst_node(state):
-        current_date = state["trade_date"]
-        ticker = state["company_of_interest"]
-
-        # Blackboard integration
-        blackboard_agent = create_agent_blackboard("NA_001", "NewsAnalyst")
-        # Read recent news analysis reports for context
-        recent_analyses = blackboard_agent.get_analysis_reports(ticker=ticker)
-        blackboard_context = ""
-        if recent_analyses:
-            blackboard_context += "\n\nRecent News Analysis Reports on Blackboard:\n"
-            for analysis in recent_analyses[-3:]:
-                content = analysis.get('content', {})
-                blackboard_context += f"- {analysis['sender'].get('role', 'Unknown')}: {content.get('recommendation', 'N/A')} (Confidence: {content.get('confidence', 'N/A')})\n"
-
-        if toolkit.config["online_tools"]:
-            tools = [toolkit.get_global_news_openai, toolkit.get_google_news]
-        else:
-            tools = [
-                toolkit.get_finnhub_news,
-                toolkit.get_reddit_news,
-            ]
-
-        system_message = (
-            "You are a news researcher tasked with analyzing recent news and trends over the past week. Please write a comprehensive report of the current state of the world that is relevant for trading and macroeconomics. Look at news from EODHD, and finnhub to be comprehensive. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
-            + " Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."
-            + f"\n\nBlackboard Context:{blackboard_context}"
-        )
-
-        json_format = """
+_JSON_FORMAT = """
                     {   
                         "prefix": "...", // The prefix of the response. If previous messages contain FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**, make sure to include it in your response too. Else, leave it empty.
                         "content": "...", // The overall summary of the response
@@ -51,68 +29,94 @@ def create_news_analyst(llm, toolkit):
                     }
                     """
 
-        system_prompt = (
-            "You are a helpful AI assistant, collaborating with other assistants."
-            " Use the provided tools to progress towards answering the question."
-            " If you are unable to fully answer, that's OK; another assistant with different tools"
-            " will help where you left off. Execute what you can to make progress."
-            " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
-            " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
-            " You have access to the following tools: {tool_names}.\n\n{system_message}\n\n"
-            "For your reference, the current date is {current_date}. We are looking at the company {ticker}."
-            " Respond ONLY with a valid JSON object in the following format: {json_format}"
-        )
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            MessagesPlaceholder(variable_name="messages"),
-        ])
-
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
-        prompt = prompt.partial(current_date=current_date)
-        prompt = prompt.partial(ticker=ticker)
-        prompt = prompt.partial(json_format=json_format)
-
-        chain = prompt | llm.bind_tools(tools)
-        result = chain.invoke(state["messages"])
-
-        report = ""
-
-        if len(result.tool_calls) == 0:
-            report = result.content.encode('utf-8', errors='replace').decode('utf-8') if result.content else ""
-
-        # Escape the result content to handle Unicode characters
-        if hasattr(result, 'content') and result.content:
-            result.content = result.content.encode('utf-8', errors='replace').decode('utf-8')
-
-        # Post the generated report to the blackboard
-        # Extract recommendation and confidence heuristically
-        recommendation = "Neutral"
-        confidence = "Medium"
-        if "BUY" in report.upper():
-            recommendation = "Bullish"
-        elif "SELL" in report.upper():
-            recommendation = "Bearish"
-        if "HIGH" in report.upper() and "CONFIDENCE" in report.upper():
-            confidence = "High"
-        elif "LOW" in report.upper() and "CONFIDENCE" in report.upper():
-            confidence = "Low"
-        analysis_content = {
-            "ticker": ticker,
-            "recommendation": recommendation,
-            "confidence": confidence,
-            "analysis": report
-        }
-        blackboard_agent.post_analysis_report(
-            ticker=ticker,
-            analysis=analysis_content,
-            confidence=confidence
-        )
-
-        return {
-            "messages": [result],
-            "news_report": report,
-        }
-
-    return news_analyst_node
+# Parsed once at import; each factory only binds its tool names. The per-call
+# blackboard, date and ticker come last so the static prefix stays shared.
+_PROMPT = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        "You are a helpful AI assistant, collaborating with other assistants."
+        " Use the provided tools to progress towards answering the question."
+        " If you are unable to fully answer, that's OK; another assistant with different tools"
+        " will help where you left off. Execute what you can to make progress."
+        " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+        " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
+        " You have access to the following tools: {tool_names}.\n\n{system_message}\n\n"
+        "Respond ONLY with a valid JSON object in the following format: {json_format}\n\n"
+        "Blackboard Context:{blackboard_context}\n\n"
+        "For your reference, the current date is {current_date}. We are looking at the company {ticker}.",
+    ),
+    MessagesPlaceholder(variable_name="messages"),
+]).partial(system_message=_SYSTEM_MESSAGE, json_format=_JSON_FORMAT)
+
+
+def _news_tools(toolkit):
+    if toolkit.config["online_tools"]:
+        return [toolkit.get_global_news_openai, toolkit.get_google_news]
+    return [
+        toolkit.get_finnhub_news,
+        toolkit.get_reddit_news,
+    ]
+
+
+def news_analyst_node(chain, blackboard_agent, state):
+    current_date = state["trade_date"]
+    ticker = state["company_of_interest"]
+
+    # Read recent news analysis reports for context
+    recent_analyses = blackboard_agent.get_analysis_reports(ticker=ticker)
+    blackboard_context = ""
+    if recent_analyses:
+        parts = ["\n\nRecent News Analysis Reports on Blackboard:\n"]
+        for analysis in recent_analyses[-3:]:
+            content = analysis.get('content', {})
+            parts.append(f"- {analysis['sender'].get('role', 'Unknown')}: {content.get('recommendation', 'N/A')} (Confidence: {content.get('confidence', 'N/A')})\n")
+        blackboard_context = "".join(parts)
+
+    result = chain.invoke({
+        "messages": state["messages"],
+        "blackboard_context": blackboard_context,
+        "current_date": current_date,
+        "ticker": ticker,
+    })
+
+    # Escape the result content to handle Unicode characters; the report is
+    # the same sanitized text, so the content is only re-encoded once
+    if hasattr(result, 'content') and result.content:
+        result.content = result.content.encode('utf-8', errors='replace').decode('utf-8')
+
+    report = ""
+
+    if len(result.tool_calls) == 0:
+        report = result.content or ""
+
+    # Post the generated report to the blackboard
+    # Extract recommendation and confidence heuristically
+    recommendation, confidence = extract_recommendation(report)
+    analysis_content = {
+        "ticker": ticker,
+        "recommendation": recommendation,
+        "confidence": confidence,
+        "analysis": report
+    }
+    blackboard_agent.post_analysis_report(
+        ticker=ticker,
+        analysis=analysis_content,
+        confidence=confidence
+    )
+
+    return {
+        "messages": [result],
+        "news_report": report,
+    }
+
+
+def create_news_analyst(llm, toolkit):
+    # The tool set is fixed by the config, so the prompt and the tool-bound
+    # chain are composed once here instead of on every node call
+    tools = _news_tools(toolkit)
+    prompt = _PROMPT.partial(tool_names=", ".join(tool.name for tool in tools))
+    chain = prompt | llm.bind_tools(tools)
+    # Blackboard integration; create_agent_blackboard returns the memoized
+    # handle for this role, bound here so the node does not look it up per call
+    blackboard_agent = create_agent_blackboard("NA_001", "NewsAnalyst")
+    return functools.partial(news_analyst_node, chain, blackboard_agent)
@@ -13,7 +13,7 @@ def create_options_trading_agent(llm, memory, toolkit):
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
         past_memories = memory.get_memories(curr_situation, n_matches=3)
 
-        past_memory_str = "\n\n".join([rec["recommendation"] for rec in past_memories])
+        past_memory_str = "\n\n".join(rec["recommendation"] for rec in past_memories)
 
         # Blackboard integration
         blackboard_agent = create_agent_blackboard("OP_001", "OptionsTradingAgent")
@@ -2,13 +2,28 @@ import time
 import json
 import os
 from datetime import datetime
+import math
 from tradingagents.blackboard.utils import create_agent_blackboard
+from tradingagents.agents.utils.agent_utils import load_portfolio_snapshot
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import SystemMessage  # Added for static system message
 import yfinance as yf
 
 
 def create_portfolio_optimizer(llm, memory, toolkit):
+    tools = [toolkit.get_portfolio_kelly_criterion,
+             toolkit.get_portfolio_risk_parity,
+             toolkit.get_portfolio_black_litterman,
+             toolkit.get_portfolio_mean_reversion,
+             toolkit.get_portfolio_momentum,
+             toolkit.perform_stress_test,
+             toolkit.calculate_beta,
+             toolkit.design_hedging_strategy,
+            ]
+    # The tool set is fixed, so the tool schemas are converted and bound to
+    # the model once here rather than on every node call
+    llm_with_tools = llm.bind_tools(tools)
+
     def portfolio_optimizer_node(state) -> dict:
 
         company_name = state["company_of_interest"]
@@ -23,9 +38,7 @@ def create_portfolio_optimizer(llm, memory, toolkit):
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
         past_memories = memory.get_memories(curr_situation, n_matches=3)
 
-        past_memory_str = ""
-        for i, rec in enumerate(past_memories, 1):
-            past_memory_str += rec["recommendation"] + "\n\n"
+        past_memory_str = "".join(rec["recommendation"] + "\n\n" for rec in past_memories)
             
         # Blackboard integration
         blackboard_agent = create_agent_blackboard("FA_001", "FundamentalAnalyst")
@@ -37,16 +50,6 @@ def create_portfolio_optimizer(llm, memory, toolkit):
             for analysis in recent_analyses[-3:]:
                 content = analysis.get('content', {})
                 blackboard_context += f"- {analysis['sender'].get('role', 'Unknown')}: {content.get('recommendation', 'N/A')} (Confidence: {content.get('confidence', 'N/A')})\n"
-                
-        tools = [toolkit.get_portfolio_kelly_criterion,
-                 toolkit.get_portfolio_risk_parity,
-                 toolkit.get_portfolio_black_litterman,
-                 toolkit.get_portfolio_mean_reversion,
-                 toolkit.get_portfolio_momentum,
-                 toolkit.perform_stress_test,
-                 toolkit.calculate_beta,
-                 toolkit.design_hedging_strategy,
-                ]
 
         quant_strategies = state.get("quant_strategies")
 
@@ -157,7 +160,7 @@ Provide specific trade recommendations, position sizes, and quantitative analysi
         )
 
         # Bind tools to the prompt/llm pipeline
-        chain = chat_prompt | llm.bind_tools(tools)
+        chain = chat_prompt | llm_with_tools
 
         # Normalize incoming messages robustly
         raw_messages = state.get("messages", []) or []
@@ -220,13 +223,16 @@ Provide specific trade recommendations, position sizes, and quantitative analysi
             except Exception:
                 portfolio_analysis = str(portfolio_analysis)
 
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Generate filename with timestamp. One clock read serves the filename
+        # and both report timestamps, so they always agree
+        generated_at = datetime.now()
+        timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
+        trade_date = state.get("trade_date", generated_at.strftime("%Y-%m-%d"))
         filename = f"portfolio_optimization_{company_name}_{timestamp}.md"
         
         # Create the markdown report content
         report_content = f"""# Portfolio Optimization Report: {company_name}
-**Generated**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**Generated**: {generated_at.strftime("%Y-%m-%d %H:%M:%S")}
 **Analyst**: Senior Quantitative Portfolio Manager
 **Target Asset**: {company_name}
 
@@ -240,7 +246,7 @@ Provide specific trade recommendations, position sizes, and quantitative analysi
 This report is generated by AI-powered quantitative analysis and should be reviewed by qualified financial professionals before implementation. Past performance does not guarantee future results. All investments carry risk of loss.
 
 ## Report Metadata
-- **Generation Time**: {datetime.now().isoformat()}
+- **Generation Time**: {generated_at.isoformat()}
 - **Asset Analyzed**: {company_name}
 - **Portfolio Optimizer Version**: 1.0
 - **Multi-Asset Coverage**: Crypto, Options, Futures, Forex, Commodities
@@ -249,7 +255,6 @@ This report is generated by AI-powered quantitative analysis and should be revie
         # Enterprise-grade results directory: results_dir/<ticker>/<date>/reports
         try:
             results_root = toolkit.config.get("results_dir", "./results")
-            trade_date = state.get("trade_date", datetime.now().strftime("%Y-%m-%d"))
             reports_dir = os.path.join(results_root, company_name, trade_date, "reports")
             os.makedirs(reports_dir, exist_ok=True)
             full_path = os.path.join(reports_dir, filename)
@@ -275,8 +280,6 @@ This report is generated by AI-powered quantitative analysis and should be revie
         }
 
         try:
-            trade_date = state.get("trade_date", datetime.now().strftime("%Y-%m-%d"))
-
             # 1) Determine target weight for the company
             target_weight = None
             try:
@@ -305,8 +308,7 @@ This report is generated by AI-powered quantitative analysis and should be revie
             data = {}
             try:
                 if os.path.exists(portfolio_path):
-                    with open(portfolio_path, "r") as pf:
-                        data = json.load(pf) or {}
+                    data = load_portfolio_snapshot(portfolio_path) or {}
             except Exception:
                 data = {
                     "liquid": 100000
@@ -324,16 +326,35 @@ This report is generated by AI-powered quantitative analysis and should be revie
                 except Exception:
                     return 0.0
 
+            def get_prices_batch(tkrs: list) -> dict:
+                # One yf.download round-trip for every symbol; per-ticker
+                # lookups only for whatever the batch could not price
+                prices = {t: 0.0 for t in tkrs}
+                try:
+                    hist = yf.download(tkrs, period="1d", group_by="ticker", threads=True, progress=False)
+                    for t in tkrs:
+                        close = hist[t]["Close"] if hist.columns.nlevels > 1 else hist["Close"]
+                        close = close.dropna()
+                        if not close.empty:
+                            prices[t] = float(close.iloc[-1])
+                except Exception:
+                    pass
+                for t in tkrs:
+                    if prices[t] <= 0:
+                        prices[t] = get_price_safe(t)
+                return prices
+
             tickers = list(portfolio_holdings.keys())
-            prices = {t: get_price_safe(t) for t in set(tickers + [company_name])}
+            prices = get_prices_batch(sorted(set(tickers + [company_name])))
 
             # Current shares and values
             existing = portfolio_holdings.get(company_name, {})
             current_shares = int(existing.get("totalAmount", 0) or 0)
             price = prices.get(company_name, 0.0)
 
-            portfolio_value_positions = sum(
-                (float(info.get("totalAmount", 0) or 0) * prices.get(t, 0.0))
+            # Revalue all holdings; a handful of positions does not justify numpy
+            portfolio_value_positions = math.fsum(
+                float(info.get("totalAmount", 0) or 0) * prices.get(t, 0.0)
                 for t, info in portfolio_holdings.items()
             )
             portfolio_value = liquid + portfolio_value_positions
@@ -341,6 +362,8 @@ This report is generated by AI-powered quantitative analysis and should be revie
             # 4) Compute target shares and trade without artificial caps
             action = None
             quantity = 0
+            # Whole shares the cash balance covers; shared by both sizing paths
+            affordable = int(liquid // price) if price > 0 else 0
 
             if target_weight is not None and price > 0:
                 target_value = max(0.0, target_weight * portfolio_value)
@@ -348,7 +371,6 @@ This report is generated by AI-powered quantitative analysis and should be revie
                 delta_shares = target_shares - current_shares
                 if delta_shares > 0:
                     # Buy as many as needed up to cash constraint
-                    affordable = int(liquid // price)
                     buy_qty = max(0, min(delta_shares, affordable))
                     if buy_qty > 0:
                         # Use the toolkit's buy function directly
@@ -375,7 +397,7 @@ This report is generated by AI-powered quantitative analysis and should be revie
                 # Fallback: follow Risk Judge recommendation without caps
                 action_text = str(risk_decision or "").upper()
                 if "BUY" in action_text and price > 0 and liquid > 0:
-                    buy_qty = int(liquid // price)
+                    buy_qty = affordable
                     if buy_qty > 0:
                         # Use the toolkit's buy function directly
                         msg = toolkit.buy(company_name, trade_date, buy_qty)
@@ -397,10 +419,10 @@ This report is generated by AI-powered quantitative analysis and should be revie
 
             # Verify execution was successful
             if action and action != "HOLD":
-                # Re-read portfolio to confirm changes
+                # Confirm changes against the state the trade tool just wrote;
+                # this only touches disk if the file changed since then
                 try:
-                    with open(portfolio_path, "r") as f:
-                        updated_portfolio = json.load(f)
+                    updated_portfolio = load_portfolio_snapshot(portfolio_path)
                     if company_name in updated_portfolio:
                         updated_shares = updated_portfolio[company_name].get("totalAmount", 0)
                         if action == "BUY" and updated_shares >= current_shares + quantity:
@@ -1,9 +1,62 @@
+import json
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, Any
 from tradingagents.agents.utils.agent_states import AgentState
 from tradingagents.blackboard.utils import create_agent_blackboard
 
+# Report directories already created by this process
+_ENSURED_DIRS = set()
+
+# Audit artifacts are written off the node's critical path. A single worker
+# keeps writes ordered; pending writes are flushed at interpreter exit.
+_ARTIFACT_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quant-artifacts")
+
+
+def _ensure_dir(path: str) -> None:
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+@contextmanager
+def _atomic_report(path: str):
+    """Open a temp file for a report and move it into place once fully written.
+
+    Readers never see a half-written report, and a failed write leaves any
+    previous report untouched.
+    """
+    # Unique per call, not per pid: threads of one process may write the same report
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            os.fchmod(fd, 0o644)  # mkstemp creates 0600; keep the file world-readable as before
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _write_report(path: str, text: str) -> None:
+    """Write a report atomically so readers never see a half-written file."""
+    with _atomic_report(path) as f:
+        f.write(text)
+
+
+def _buy_signals(result: Any) -> Dict[str, Any]:
+    """BUY entries of a toolkit signal scan; error payloads and odd shapes yield none."""
+    signals = result.get("signals") if isinstance(result, dict) else None
+    if not isinstance(signals, dict):
+        return {}
+    return {
+        t: d for t, d in signals.items() if isinstance(d, dict) and d.get("signal") == "BUY"
+    }
+
 
 def create_quant_options_manager(llm, memory, toolkit):
     def quant_options_manager_node(state: AgentState) -> Dict[str, Any]:
@@ -44,12 +97,18 @@ def create_quant_options_manager(llm, memory, toolkit):
         # Prepare enterprise results directory
         results_root = toolkit.config.get("results_dir", "./results")
         reports_dir = os.path.join(results_root, ticker, trade_date, "reports")
-        os.makedirs(reports_dir, exist_ok=True)
-
-        # Use Toolkit quantitative tools for signals (exclude Kelly entirely)
-        momentum = toolkit.get_portfolio_momentum.invoke({})
-        mean_rev = toolkit.get_portfolio_mean_reversion.invoke({})
-        risk_parity = toolkit.get_portfolio_risk_parity.invoke({})
+        _ensure_dir(reports_dir)
+
+        # Use Toolkit quantitative tools for signals (exclude Kelly entirely).
+        # The three scans are independent and spend their time waiting on
+        # yfinance, so run them side by side instead of back to back.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            momentum_future = pool.submit(toolkit.get_portfolio_momentum.invoke, {})
+            mean_rev_future = pool.submit(toolkit.get_portfolio_mean_reversion.invoke, {})
+            risk_parity_future = pool.submit(toolkit.get_portfolio_risk_parity.invoke, {})
+        momentum = momentum_future.result()
+        mean_rev = mean_rev_future.result()
+        risk_parity = risk_parity_future.result()
 
         # Score and select strategies
         quant_findings: Dict[str, Any] = {
@@ -60,33 +119,24 @@ def create_quant_options_manager(llm, memory, toolkit):
 
         # Simple enterprise selection heuristic
         selected_strategies = {}
-        try:
-            # Prefer momentum BUY opportunities
-            buy_momentum = {
-                t: d for t, d in (momentum.get("signals") or {}).items() if d.get("signal") == "BUY"
+
+        # Prefer momentum BUY opportunities
+        buy_momentum = _buy_signals(momentum)
+        if buy_momentum:
+            selected_strategies["momentum"] = {
+                "action": "OVERWEIGHT",
+                "targets": buy_momentum,
+                "rationale": "Positive momentum with non-overbought RSI",
             }
-            if buy_momentum:
-                selected_strategies["momentum"] = {
-                    "action": "OVERWEIGHT",
-                    "targets": buy_momentum,
-                    "rationale": "Positive momentum with non-overbought RSI",
-                }
-        except Exception:
-            pass
 
-        try:
-            # Mean reversion BUY opportunities
-            buy_mean = {
-                t: d for t, d in (mean_rev.get("signals") or {}).items() if d.get("signal") == "BUY"
+        # Mean reversion BUY opportunities
+        buy_mean = _buy_signals(mean_rev)
+        if buy_mean:
+            selected_strategies["mean_reversion"] = {
+                "action": "ACCUMULATE",
+                "targets": buy_mean,
+                "rationale": "Undervalued vs rolling mean; expect reversion",
             }
-            if buy_mean:
-                selected_strategies["mean_reversion"] = {
-                    "action": "ACCUMULATE",
-                    "targets": buy_mean,
-                    "rationale": "Undervalued vs rolling mean; expect reversion",
-                }
-        except Exception:
-            pass
 
         # Explicitly exclude Kelly sizing logic per requirements
 
@@ -98,66 +148,73 @@ def create_quant_options_manager(llm, memory, toolkit):
                 "rationale": "Inverse volatility weighting to equalize risk contributions",
             }
 
-        # Persist a concise JSON artifact for audit
+        # Serialize the audit payload once; both the JSON artifact and the
+        # Markdown report embed the same text
         try:
+            findings_json = json.dumps({
+                "inputs": {"ticker": ticker, "date": trade_date},
+                "findings": quant_findings,
+                "selected": selected_strategies,
+            }, indent=2)
+        except Exception:
+            findings_json = None
+
+        # Persist a concise JSON artifact for audit. Nothing downstream reads
+        # it back, so hand the write to the background writer and move on
+        if findings_json is not None:
             artifact_path = os.path.join(
                 reports_dir, f"quant_findings_{ticker}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             )
-            import json
-
-            with open(artifact_path, "w", encoding="utf-8") as f:
-                json.dump({"inputs": {"ticker": ticker, "date": trade_date}, "findings": quant_findings, "selected": selected_strategies}, f, indent=2)
-        except Exception:
-            pass
+            _ARTIFACT_WRITER.submit(_write_report, artifact_path, findings_json)
 
         # Write a human-readable Markdown report with findings
         md_path = None
         try:
             md_path = os.path.join(reports_dir, "quantoptionsstrat.md")
-            lines = []
-            lines.append(f"# Quant Options Strategy Report: {ticker} ({trade_date})\n")
-            lines.append("## Executive Summary\n")
-            if selected_strategies:
-                lines.append("High-confidence quantitative opportunities detected and forwarded to portfolio optimization.\n")
-            else:
-                lines.append("No high-confidence quantitative strategies identified. Baseline risk frameworks retained.\n")
-            lines.append("\n## Selected Strategies\n")
-            if selected_strategies:
-                for name, payload in selected_strategies.items():
-                    lines.append(f"### {name.replace('_', ' ').title()}\n")
-                    if isinstance(payload, dict):
-                        for k, v in payload.items():
-                            if k in ("targets", "weights") and isinstance(v, dict):
-                                lines.append(f"- **{k}**:\n")
-                                for kt, kv in v.items():
-                                    lines.append(f"  - {kt}: {kv}")
-                            else:
-                                lines.append(f"- **{k}**: {v}")
-                    else:
-                        lines.append(f"- {payload}")
-                    lines.append("")
-            else:
-                lines.append("- None\n")
-            lines.append("\n## Raw Findings (for audit)\n")
-            lines.append("```json")
-            import json as _json
-            lines.append(_json.dumps({
-                "inputs": {"ticker": ticker, "date": trade_date},
-                "findings": quant_findings,
-                "selected": selected_strategies,
-            }, indent=2))
-            lines.append("```\n")
-            with open(md_path, "w", encoding="utf-8") as f_md:
-                f_md.write("\n".join(lines))
+            # Sections go straight to the (temp) report file rather than
+            # being assembled in memory first
+            with _atomic_report(md_path) as f:
+                w = f.write
+                w(f"# Quant Options Strategy Report: {ticker} ({trade_date})\n\n")
+                w("## Executive Summary\n\n")
+                if selected_strategies:
+                    w("High-confidence quantitative opportunities detected and forwarded to portfolio optimization.\n\n")
+                else:
+                    w("No high-confidence quantitative strategies identified. Baseline risk frameworks retained.\n\n")
+                w("\n## Selected Strategies\n\n")
+                if selected_strategies:
+                    for name, payload in selected_strategies.items():
+                        w(f"### {name.replace('_', ' ').title()}\n\n")
+                        if isinstance(payload, dict):
+                            for k, v in payload.items():
+                                if k in ("targets", "weights") and isinstance(v, dict):
+                                    w(f"- **{k}**:\n\n")
+                                    for kt, kv in v.items():
+                                        w(f"  - {kt}: {kv}\n")
+                                else:
+                                    w(f"- **{k}**: {v}\n")
+                        else:
+                            w(f"- {payload}\n")
+                        w("\n")
+                else:
+                    w("- None\n\n")
+                w("\n## Raw Findings (for audit)\n\n")
+                w("```json\n")
+                w(findings_json if findings_json is not None else str(quant_findings))
+                w("\n```\n")
         except Exception:
             md_path = None
 
+        # Compact, key-sorted JSON for text that other agents read back into
+        # their prompts: fewer tokens than a dict repr and identical across runs
+        selected_text = json.dumps(selected_strategies, sort_keys=True, separators=(",", ":"), default=str)
+
         # Blackboard logging for enterprise visibility
         try:
             blackboard_agent.post_investment_decision(
                 ticker=ticker,
                 decision="Quant Strategy Scan",
-                reasoning=str(selected_strategies),
+                reasoning=selected_text,
                 confidence="N/A",
             )
         except Exception:
@@ -168,7 +225,7 @@ def create_quant_options_manager(llm, memory, toolkit):
             memory.add_situations([
                 (
                     f"Quant scan for {ticker} on {trade_date}",
-                    f"Selected strategies: {str(selected_strategies)[:500]}...",
+                    f"Selected strategies: {selected_text[:500]}...",
                 )
             ])
         except Exception:
@@ -1,7 +1,7 @@
 import time
 import json
 from tradingagents.blackboard.utils import create_agent_blackboard
-from tradingagents.agents.utils.debate_utils import get_debate_round_info
+from tradingagents.agents.utils.debate_utils import get_debate_round_info, scan_keywords
 
 
 def create_research_manager(llm, memory):
@@ -37,9 +37,7 @@ def create_research_manager(llm, memory):
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
-        past_memory_str = ""
-        for i, rec in enumerate(past_memories, 1):
-            past_memory_str += rec["recommendation"] + "\n\n"
+        past_memory_str = "".join(rec["recommendation"] + "\n\n" for rec in past_memories)
         
         json_format = """{
     "recommendation": "...", // Your final recommendation (Buy, Sell, or Hold)
@@ -80,16 +78,16 @@ Respond ONLY with a valid JSON object in the following format:
         # Extract decision and confidence from response
         decision = "Hold"
         confidence = "Medium"
-        response_text = response.content.upper()
+        response_keywords = scan_keywords(response.content)
         
-        if "BUY" in response_text:
+        if "BUY" in response_keywords:
             decision = "Buy"
-        elif "SELL" in response_text:
+        elif "SELL" in response_keywords:
             decision = "Sell"
         
-        if "HIGH" in response_text and "CONFIDENCE" in response_text:
+        if "HIGH" in response_keywords and "CONFIDENCE" in response_keywords:
             confidence = "High"
-        elif "LOW" in response_text and "CONFIDENCE" in response_text:
+        elif "LOW" in response_keywords and "CONFIDENCE" in response_keywords:
             confidence = "Low"
 
         # Post investment decision to blackboard
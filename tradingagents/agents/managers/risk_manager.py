@@ -1,6 +1,7 @@
 import time
 import json
 from tradingagents.blackboard.utils import create_agent_blackboard
+from tradingagents.agents.utils.debate_utils import scan_keywords
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
 
@@ -43,9 +44,7 @@ def create_risk_manager(llm, memory, toolkit):
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
-        past_memory_str = ""
-        for i, rec in enumerate(past_memories, 1):
-            past_memory_str += rec["recommendation"] + "\n\n"
+        past_memory_str = "".join(rec["recommendation"] + "\n\n" for rec in past_memories)
 
         # Build system message (use existing base prompt text)
         system_message = f"""As the Risk Management Judge and Debate Facilitator, your goal is to evaluate the debate between three risk analysts—Risky, Neutral, and Safe/Conservative—and determine the best course of action for the trader. Your decision must result in a clear recommendation: Buy, Sell, or Hold. Choose Hold only if strongly justified by specific arguments, not as a fallback when all sides seem valid. Strive for clarity and decisiveness.
@@ -88,32 +87,32 @@ Do not execute any trades or call tools. Produce a clear BUY/SELL/HOLD recommend
         decision = "Hold"
         risk_level = "Medium"
         confidence = "Medium"
-        rt = response_text.upper()
-        if "BUY" in rt:
+        response_keywords = scan_keywords(response_text)
+        if "BUY" in response_keywords:
             decision = "Buy"
-        elif "SELL" in rt:
+        elif "SELL" in response_keywords:
             decision = "Sell"
 
-        if "HIGH" in rt and "RISK" in rt:
+        if "HIGH" in response_keywords and "RISK" in response_keywords:
             risk_level = "High"
-        elif "LOW" in rt and "RISK" in rt:
+        elif "LOW" in response_keywords and "RISK" in response_keywords:
             risk_level = "Low"
-        elif "CRITICAL" in rt:
+        elif "CRITICAL" in response_keywords:
             risk_level = "Critical"
 
-        if "HIGH" in rt and "CONFIDENCE" in rt:
+        if "HIGH" in response_keywords and "CONFIDENCE" in response_keywords:
             confidence = "High"
-        elif "LOW" in rt and "CONFIDENCE" in rt:
+        elif "LOW" in response_keywords and "CONFIDENCE" in response_keywords:
             confidence = "Low"
 
         risk_factors = []
-        if "VOLATILITY" in rt:
+        if "VOLATILITY" in response_keywords:
             risk_factors.append("Market Volatility")
-        if "LIQUIDITY" in rt:
+        if "LIQUIDITY" in response_keywords:
             risk_factors.append("Liquidity Risk")
-        if "REGULATORY" in rt:
+        if "REGULATORY" in response_keywords:
             risk_factors.append("Regulatory Risk")
-        if "COMPANY" in rt and "SPECIFIC" in rt:
+        if "COMPANY" in response_keywords and "SPECIFIC" in response_keywords:
             risk_factors.append("Company-Specific Risk")
         if not risk_factors:
             risk_factors = ["General Market Risk"]
@@ -156,9 +155,10 @@ Do not execute any trades or call tools. Produce a clear BUY/SELL/HOLD recommend
             "count": risk_debate_state["count"],
         }
 
-        # store serializable message content instead of the full chain result object
+        # store serializable message content instead of the full chain result object.
+        # The add_messages reducer appends it, so only the new message is returned
         return {
-            "messages": state.get("messages", []) + [{"role": "assistant", "content": response_text}],
+            "messages": [{"role": "assistant", "content": response_text}],
             "risk_debate_state": new_risk_debate_state,
             "final_trade_decision": response_text,
         }
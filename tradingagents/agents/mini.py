@@ -0,0 +1,46 @@
+"""Lightweight subset of tradingagents.agents for strategy-only runs.
+
+Re-exports the analysts, researchers and trader (plus the shared utils they
+need) through the package's lazy loader, so importing this module never
+pulls in the manager submodules such as the portfolio optimizer or the
+quant options manager.
+"""
+
+from . import _resolve, _warm
+
+__all__ = tuple(sorted({
+    "FinancialSituationMemory",
+    "Toolkit",
+    "AgentState",
+    "create_msg_delete",
+    "InvestDebateState",
+    "RiskDebateState",
+    "create_fundamentals_analyst",
+    "create_market_analyst",
+    "create_macroeconomic_analyst",
+    "create_news_analyst",
+    "create_social_media_analyst",
+    "create_bear_researcher",
+    "create_bull_researcher",
+    "create_bear_crossex_researcher",
+    "create_bull_crossex_researcher",
+    "create_trader",
+}))
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = globals()[name] = _resolve(name)
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def warmup(max_workers=8):
+    """Import only this subset's submodules, concurrently."""
+    _warm(__all__, max_workers)
+    for name in __all__:
+        globals()[name] = _resolve(name)
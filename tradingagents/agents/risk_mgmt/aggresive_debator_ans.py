@@ -3,6 +3,7 @@
 import time
 import json
 from tradingagents.blackboard.utils import create_agent_blackboard
+from tradingagents.agents.utils.debate_utils import scan_keywords
 
 
 def create_risky_debator_ans(llm):
@@ -99,17 +100,17 @@ Generate your response in the following JSON format:
 
         # Extract confidence from response
         confidence = "Medium"
-        response_text = response.content.upper()
-        if "HIGH" in response_text and "CONFIDENCE" in response_text:
+        response_keywords = scan_keywords(response.content)
+        if "HIGH" in response_keywords and "CONFIDENCE" in response_keywords:
             confidence = "High"
-        elif "LOW" in response_text and "CONFIDENCE" in response_text:
+        elif "LOW" in response_keywords and "CONFIDENCE" in response_keywords:
             confidence = "Low"
 
         # Extract risk level from response
         risk_level = "High"
-        if "LOW" in response_text and "RISK" in response_text:
+        if "LOW" in response_keywords and "RISK" in response_keywords:
             risk_level = "Low"
-        elif "MEDIUM" in response_text and "RISK" in response_text:
+        elif "MEDIUM" in response_keywords and "RISK" in response_keywords:
             risk_level = "Medium"
 
         # Determine reply_to for threading
@@ -1,10 +1,16 @@
 import functools
+import re
 import time
 import json
 from datetime import datetime
 from tradingagents.blackboard.utils import create_agent_blackboard
+from tradingagents.agents.utils.debate_utils import scan_keywords
 from tradingagents.agents.utils.agent_utils import Toolkit
 
+# Proposed trade actions, matched case-insensitively in one pass over the
+# response; a BUY proposal wins over a SELL one, anything else is a HOLD
+_PROPOSAL_RE = re.compile(r"FINAL TRANSACTION PROPOSAL: \*\*(BUY|SELL)\*\*", re.IGNORECASE)
+
 
 def create_trader(llm, memory):
 
@@ -72,10 +78,8 @@ def create_trader(llm, memory):
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
-        past_memory_str = ""
         if past_memories:
-            for i, rec in enumerate(past_memories, 1):
-                past_memory_str += rec["recommendation"] + "\n\n"
+            past_memory_str = "".join(rec["recommendation"] + "\n\n" for rec in past_memories)
         else:
             past_memory_str = "No past memories found."
 
@@ -112,18 +116,15 @@ Consider all the insights from analysts, risk managers, research managers, and c
         result = llm.invoke(messages)
 
         # Extract trade decision from response
-        response_text = result.content.upper()
-        trade_action = "HOLD"
-        if "FINAL TRANSACTION PROPOSAL: **BUY**" in response_text:
-            trade_action = "BUY"
-        elif "FINAL TRANSACTION PROPOSAL: **SELL**" in response_text:
-            trade_action = "SELL"
+        proposed = {action.upper() for action in _PROPOSAL_RE.findall(result.content)}
+        trade_action = next((action for action in ("BUY", "SELL") if action in proposed), "HOLD")
 
         # Extract confidence from response
         confidence = "Medium"
-        if "HIGH" in response_text and "CONFIDENCE" in response_text:
+        response_keywords = scan_keywords(result.content)
+        if "HIGH" in response_keywords and "CONFIDENCE" in response_keywords:
             confidence = "High"
-        elif "LOW" in response_text and "CONFIDENCE" in response_text:
+        elif "LOW" in response_keywords and "CONFIDENCE" in response_keywords:
             confidence = "Low"
 
         # Post trade decision to blackboard
@@ -9,12 +9,15 @@ import functools
 import pandas as pd
 import numpy as np
 import os
+import tempfile
 from dateutil.relativedelta import relativedelta
 from langchain_openai import ChatOpenAI
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.dataflows import interface
 import json
 import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
 
 
 def create_msg_delete():
@@ -33,6 +36,168 @@ def create_msg_delete():
     return delete_messages
 
 
+# Beta band edges and the label for each band (bisect_right picks the band)
+_BETA_BREAKS = (0.7, 0.85, 1.15, 1.3)
+_BETA_CATEGORIES = (
+    "Low Beta (Defensive)",
+    "Below Market",
+    "Market Neutral",
+    "Above Market",
+    "High Beta (Aggressive)",
+)
+
+# Risk tolerance band edges and the (urgency, hedge coverage) plan for each band
+_RISK_TOLERANCE_BREAKS = (0.3, 0.7)
+_HEDGE_PLANS = (
+    ("High - Implement comprehensive hedging immediately", "80-100% of portfolio value"),
+    ("Medium - Gradual hedging implementation", "50-80% of portfolio value"),
+    ("Low - Selective hedging for tail risks only", "20-50% of portfolio value"),
+)
+
+# Static hedging playbook shared by every design_hedging_strategy call; built once
+# at import instead of on each invocation. Treat as read-only.
+_HEDGE_INDICES = {"SPY": "S&P 500", "QQQ": "NASDAQ", "IWM": "Russell 2000", "EFA": "International"}
+_COLLAR_STRATEGY = {
+    "strategy": "Collar (Buy Put, Sell Call)",
+    "put_strike": "95% of portfolio value",
+    "call_strike": "105% of portfolio value",
+    "net_premium": "Near zero (premium neutral)",
+    "max_upside": "5% above current value",
+    "max_downside": "5% below current value"
+}
+_CRYPTO_HEDGES = {
+    "BTC": {
+        "asset_name": "Bitcoin",
+        "hedge_rationale": "Inflation hedge and currency debasement protection",
+        "recommended_allocation": "2-5% of portfolio",
+        "correlation_with_stocks": "Medium (0.3-0.6)",
+        "volatility_profile": "Very High"
+    },
+    "ETH": {
+        "asset_name": "Ethereum",
+        "hedge_rationale": "Technology disruption and digital asset exposure",
+        "recommended_allocation": "1-3% of portfolio",
+        "correlation_with_stocks": "Medium-High (0.4-0.7)",
+        "volatility_profile": "Very High"
+    }
+}
+_COMMODITY_HEDGES = {
+    "GLD": {
+        "commodity": "Gold",
+        "hedge_purpose": "Inflation and currency hedge",
+        "recommended_allocation": "5-10% of portfolio",
+        "implementation": "GLD ETF or futures"
+    },
+    "USO": {
+        "commodity": "Oil",
+        "hedge_purpose": "Energy inflation hedge",
+        "recommended_allocation": "2-5% of portfolio",
+        "implementation": "USO ETF or oil futures"
+    },
+    "DBA": {
+        "commodity": "Agricultural",
+        "hedge_purpose": "Food inflation hedge",
+        "recommended_allocation": "2-3% of portfolio",
+        "implementation": "DBA ETF or agricultural futures"
+    }
+}
+_FOREX_HEDGES = {
+    "USD_strength": {
+        "scenario": "USD Strengthening",
+        "impact_on_portfolio": "Negative for international stocks",
+        "hedge": "Long USD index (DXY) or short foreign currency ETFs"
+    },
+    "USD_weakness": {
+        "scenario": "USD Weakening",
+        "impact_on_portfolio": "Positive for international stocks",
+        "hedge": "Foreign currency ETFs (FXE, FXY) or international bonds"
+    }
+}
+_VOL_HEDGES = {
+    "VIX_protection": {
+        "instrument": "VIX ETFs (VXX, UVXY)",
+        "purpose": "Profit from volatility spikes",
+        "allocation": "1-2% of portfolio",
+        "timing": "Buy during low volatility periods"
+    },
+    "long_vol_strategies": {
+        "instrument": "Long volatility options strategies",
+        "purpose": "Tail risk protection",
+        "cost": "1-3% annually",
+        "effectiveness": "High during market crashes"
+    }
+}
+
+
+# Last parsed/written portfolio.json per absolute path, tagged with the file's
+# (mtime_ns, size) so a stale entry is never served
+_PORTFOLIO_SNAPSHOTS = {}
+
+
+def _remember_portfolio(portfolio_path, data):
+    """Record the state just written to portfolio_path for later read-only loads."""
+    st = os.stat(portfolio_path)
+    _PORTFOLIO_SNAPSHOTS[os.path.abspath(portfolio_path)] = ((st.st_mtime_ns, st.st_size), data)
+
+
+def _write_portfolio(portfolio_path, data):
+    """Atomically replace portfolio.json so concurrent readers (e.g. testingLoop
+    --workers processes) never see a half-written file."""
+    # Encode into one buffer and write it in a single call; json.dump would
+    # issue a separate write() for every chunk of the (growing) trade history
+    encoded = json.dumps(data, indent=2)
+    # Unique temp name: the riskJudge ToolNode runs parallel trade calls as
+    # threads of one process, so a pid-only name would be shared between them
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(portfolio_path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            os.fchmod(fd, 0o644)  # mkstemp creates 0600; keep the file world-readable as before
+            f.write(encoded)
+        os.replace(tmp_path, portfolio_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _remember_portfolio(portfolio_path, data)
+
+
+def load_portfolio_snapshot(portfolio_path):
+    """Return the parsed portfolio.json, reusing the last read or write while the file is unchanged.
+
+    The returned dict is shared; callers must treat it as read-only.
+    """
+    st = os.stat(portfolio_path)
+    key = os.path.abspath(portfolio_path)
+    cached = _PORTFOLIO_SNAPSHOTS.get(key)
+    if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+        return cached[1]
+    with open(portfolio_path, "r") as f:
+        data = json.load(f)
+    _PORTFOLIO_SNAPSHOTS[key] = ((st.st_mtime_ns, st.st_size), data)
+    return data
+
+
+def _fetch_histories(tickers, start_date, end_date):
+    """Fetch yfinance price history for several tickers concurrently.
+
+    Returns {ticker: DataFrame} in the input order, omitting tickers whose
+    request failed.
+    """
+    def fetch(ticker):
+        try:
+            return yf.Ticker(ticker).history(start=start_date, end=end_date)
+        except Exception:
+            return None
+
+    if not tickers:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as pool:
+        results = list(pool.map(fetch, tickers))
+    return {t: hist for t, hist in zip(tickers, results) if hist is not None}
+
+
 class Toolkit:
     _config = DEFAULT_CONFIG.copy()
 
@@ -429,7 +594,8 @@ class Toolkit:
         portfolio_path = os.path.join(os.path.dirname(__file__), "../../../config/portfolio.json")
         if not os.path.exists(portfolio_path):
             return f"No portfolio exists."
-        portfolio = json.load(open(portfolio_path, "r"))
+        with open(portfolio_path, "r") as f:
+            portfolio = json.load(f)
         stockportfolio = portfolio.get(ticker, {})
         if not stockportfolio:
             return f"No holdings for {ticker} in portfolio."
@@ -467,10 +633,12 @@ class Toolkit:
     def buy_impl(ticker, date: Annotated[str, "Date of the purchase in yyyy-mm-dd format"], quantity = 1) -> str:
         """Implementation to buy shares and persist to portfolio.json"""
         portfolio_path = os.path.join(os.path.dirname(__file__), "../../../config/portfolio.json")
-        if not os.path.exists(portfolio_path):
-            with open(portfolio_path, "w") as f:
-                json.dump({"portfolio": {}, "liquid": 0}, f)
-        data = json.load(open(portfolio_path, "r"))
+        # A missing portfolio starts empty in memory; it is written once below
+        if os.path.exists(portfolio_path):
+            with open(portfolio_path, "r") as f:
+                data = json.load(f)
+        else:
+            data = {"portfolio": {}, "liquid": 0}
         if "portfolio" not in data or not isinstance(data["portfolio"], dict):
             data["portfolio"] = {}
         holdings = data["portfolio"].get(ticker, {"totalAmount": 0, "trades": []})
@@ -483,12 +651,11 @@ class Toolkit:
         except Exception as e:
             print(f"⚠️ Warning: Could not fetch current price for {ticker}: {str(e)}")
             current_price = 0.0
-        # Update liquidity if present
-        if "liquid" not in data:
-            data["liquid"] = 0
+        # Read liquidity once and clamp the order to what it can afford
+        liquid = data.get("liquid", 0)
         cost = quantity * current_price
-        if data["liquid"] < cost and current_price > 0:
-            quantity = int(data["liquid"] // current_price)
+        if liquid < cost and current_price > 0:
+            quantity = int(liquid // current_price)
             cost = quantity * current_price
             if quantity == 0:
                 return f"Insufficient liquidity to buy {ticker}."
@@ -505,9 +672,8 @@ class Toolkit:
         }
         holdings["trades"].append(transaction)
         data["portfolio"][ticker] = holdings
-        data["liquid"] = max(0, data.get("liquid", 0) - cost)
-        with open(portfolio_path, "w") as f:
-            json.dump(data, f, indent=2)
+        data["liquid"] = max(0, liquid - cost)
+        _write_portfolio(portfolio_path, data)
         print(f"✅ BUY EXECUTED: {quantity} shares of {ticker} at ${current_price:.2f} for ${cost:.2f}")
         print(f"💰 Remaining liquid cash: ${data['liquid']:.2f}")
 
@@ -525,10 +691,12 @@ class Toolkit:
     def hold_impl(ticker: str, date: str, note: str = "") -> str:
         """Persist a HOLD decision as a portfolio transaction (quantity 0) so actions are auditable."""
         portfolio_path = os.path.join(os.path.dirname(__file__), "../../../config/portfolio.json")
-        if not os.path.exists(portfolio_path):
-            with open(portfolio_path, "w") as f:
-                json.dump({"portfolio": {}, "liquid": 0}, f)
-        data = json.load(open(portfolio_path, "r"))
+        # A missing portfolio starts empty in memory; it is written once below
+        if os.path.exists(portfolio_path):
+            with open(portfolio_path, "r") as f:
+                data = json.load(f)
+        else:
+            data = {"portfolio": {}, "liquid": 0}
         if "portfolio" not in data or not isinstance(data["portfolio"], dict):
             data["portfolio"] = {}
         holdings = data["portfolio"].get(ticker, {"totalAmount": 0, "trades": []})
@@ -544,8 +712,7 @@ class Toolkit:
             "ticker": ticker
         })
         data["portfolio"][ticker] = holdings
-        with open(portfolio_path, "w") as f:
-            json.dump(data, f, indent=2)
+        _write_portfolio(portfolio_path, data)
             
         print(f"✅ HOLD EXECUTED: {ticker} - {note if note else 'No action taken'}")
         
@@ -568,7 +735,8 @@ class Toolkit:
         portfolio_path = os.path.join(os.path.dirname(__file__), "../../../config/portfolio.json")
         if not os.path.exists(portfolio_path):
             return f"No portfolio exists to sell {ticker}."
-        data = json.load(open(portfolio_path, "r"))
+        with open(portfolio_path, "r") as f:
+            data = json.load(f)
         if "portfolio" not in data or ticker not in data["portfolio"]:
             return f"No holdings for {ticker}."
         holdings = data["portfolio"][ticker]
@@ -596,8 +764,7 @@ class Toolkit:
         })
         data["portfolio"][ticker] = holdings
         data["liquid"] = data.get("liquid", 0) + sell_qty * current_price
-        with open(portfolio_path, "w") as f:
-            json.dump(data, f, indent=2)
+        _write_portfolio(portfolio_path, data)
         
         sale_proceeds = sell_qty * current_price
 
@@ -709,11 +876,9 @@ class Toolkit:
             returns_data = {}
             volatilities = {}
             
-            for ticker in tickers:
+            histories = _fetch_histories(tickers, start_date, end_date)
+            for ticker, hist in histories.items():
                 try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(start=start_date, end=end_date)
-                    
                     if len(hist) > 1:
                         returns = hist['Close'].pct_change().dropna()
                         volatility = returns.std() * np.sqrt(252)  # Annualized volatility
@@ -725,26 +890,24 @@ class Toolkit:
             if not volatilities:
                 return {"error": "Could not fetch data for any tickers", "weights": {}}
             
-            # Calculate inverse volatility weights
-            inv_vol = {ticker: 1/vol for ticker, vol in volatilities.items()}
-            total_inv_vol = sum(inv_vol.values())
-            
-            # Normalize to get weights
-            weights = {ticker: weight/total_inv_vol for ticker, weight in inv_vol.items()}
+            # Calculate normalized inverse volatility weights
+            names = list(volatilities)
+            vols = np.array([volatilities[t] for t in names])
+            inv_vol = 1.0 / vols
+            w = inv_vol / inv_vol.sum()
             
-            # Calculate portfolio metrics
-            portfolio_vol = np.sqrt(sum(weights[t1] * weights[t2] * 
-                                       np.corrcoef(returns_data[t1], returns_data[t2])[0,1] *
-                                       volatilities[t1] * volatilities[t2]
-                                       for t1 in weights for t2 in weights
-                                       if t1 in returns_data and t2 in returns_data))
+            # Calculate portfolio metrics: sqrt(w' * (corr * vol vol') * w), with
+            # the correlation matrix computed once over date-aligned returns
+            # instead of one np.corrcoef call per ticker pair
+            corr = pd.DataFrame(returns_data)[names].corr().to_numpy()
+            portfolio_vol = np.sqrt(w @ (corr * np.outer(vols, vols)) @ w)
             
             return {
                 "strategy": "Risk Parity",
-                "weights": {ticker: round(weight, 4) for ticker, weight in weights.items()},
+                "weights": {ticker: round(float(weight), 4) for ticker, weight in zip(names, w)},
                 "individual_volatilities": {ticker: round(vol, 4) for ticker, vol in volatilities.items()},
                 "portfolio_volatility": round(portfolio_vol, 4),
-                "diversification_ratio": round(sum(weights[t] * volatilities[t] for t in weights) / portfolio_vol, 2),
+                "diversification_ratio": round(float(w @ vols) / portfolio_vol, 2),
                 "methodology": "Inverse volatility weighting to equalize risk contribution"
             }
             
@@ -799,11 +962,9 @@ class Toolkit:
             
             returns_data = {}
             
-            for ticker in tickers:
+            histories = _fetch_histories(tickers, start_date, end_date)
+            for ticker, hist in histories.items():
                 try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(start=start_date, end=end_date)
-                    
                     if len(hist) > 1:
                         returns = hist['Close'].pct_change().dropna()
                         returns_data[ticker] = returns
@@ -915,18 +1076,18 @@ class Toolkit:
             z_scores = {}
             current_prices = {}
             
-            for ticker in tickers:
+            histories = _fetch_histories(tickers, start_date, end_date)
+            for ticker, hist in histories.items():
                 try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(start=start_date, end=end_date)
-                    
                     if len(hist) > lookback_days:
                         prices = hist['Close']
                         current_price = prices.iloc[-1]
                         
-                        # Calculate rolling statistics
-                        rolling_mean = prices.rolling(window=lookback_days).mean().iloc[-1]
-                        rolling_std = prices.rolling(window=lookback_days).std().iloc[-1]
+                        # Calculate rolling statistics (only the latest window is used,
+                        # so compute it directly instead of the full rolling series)
+                        window = prices.iloc[-lookback_days:]
+                        rolling_mean = window.mean()
+                        rolling_std = window.std()
                         
                         # Calculate z-score
                         z_score = (current_price - rolling_mean) / rolling_std if rolling_std > 0 else 0
@@ -1031,17 +1192,15 @@ class Toolkit:
             momentum_signals = {}
             momentum_scores = {}
             
-            for ticker in tickers:
+            histories = _fetch_histories(tickers, start_date, end_date)
+            for ticker, hist in histories.items():
                 try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(start=start_date, end=end_date)
-                    
                     if len(hist) > long_period:
                         prices = hist['Close']
                         
-                        # Calculate momentum indicators
-                        short_ma = prices.rolling(window=short_period).mean().iloc[-1]
-                        long_ma = prices.rolling(window=long_period).mean().iloc[-1]
+                        # Calculate momentum indicators from the trailing windows only
+                        short_ma = prices.iloc[-short_period:].mean()
+                        long_ma = prices.iloc[-long_period:].mean()
                         current_price = prices.iloc[-1]
                         
                         # Price momentum (rate of change)
@@ -1187,11 +1346,9 @@ class Toolkit:
             returns_data = {}
             price_data = {}
             
-            for ticker in tickers:
+            histories = _fetch_histories(tickers, start_date, end_date)
+            for ticker, hist in histories.items():
                 try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(start=start_date, end=end_date)
-                    
                     if len(hist) > 1:
                         returns = hist['Close'].pct_change().dropna()
                         returns_data[ticker] = returns
@@ -1220,8 +1377,14 @@ class Toolkit:
             
             stress_test_results = {}
             
+            # Work on a (days x tickers) array; weights are aligned to the
+            # columns actually fetched so a missing ticker cannot shift them
+            columns = list(returns_df.columns)
+            returns_arr = returns_df.to_numpy()
+            weights_arr = np.array([portfolio_weights.get(ticker, 0) for ticker in columns])
+            
             # Calculate baseline portfolio metrics
-            portfolio_returns = np.dot(returns_df.values, list(portfolio_weights.values()))
+            portfolio_returns = returns_arr @ weights_arr
             baseline_volatility = np.std(portfolio_returns) * np.sqrt(252)  # Annualized
             baseline_var = np.percentile(portfolio_returns, confidence_level * 100)
             baseline_cvar = np.mean(portfolio_returns[portfolio_returns <= baseline_var])
@@ -1233,32 +1396,24 @@ class Toolkit:
                 volatility_spike = scenario.get("volatility_spike", 2.0)
                 correlation_increase = scenario.get("correlation_increase", 0.3)
                 
-                # Simulate stressed returns
-                stressed_returns = returns_df.copy()
-                
-                # Apply market shock (systematic risk)
-                for ticker in tickers:
-                    if ticker in stressed_returns.columns:
-                        # Apply market shock with some idiosyncratic variation
-                        idiosyncratic_factor = np.random.normal(1.0, 0.1, len(stressed_returns))
-                        shock = market_shock * idiosyncratic_factor
-                        stressed_returns[ticker] = stressed_returns[ticker] + shock
+                # Apply market shock (systematic risk) with some idiosyncratic
+                # variation; drawn per ticker, then laid out as columns
+                idiosyncratic_factor = np.random.normal(1.0, 0.1, (len(columns), len(returns_arr))).T
+                shocked = returns_arr + market_shock * idiosyncratic_factor
                 
-                # Increase volatility
-                for ticker in tickers:
-                    if ticker in stressed_returns.columns:
-                        mean_return = stressed_returns[ticker].mean()
-                        stressed_returns[ticker] = mean_return + (stressed_returns[ticker] - mean_return) * volatility_spike
+                # Increase volatility around each ticker's mean
+                mean_return = np.nanmean(shocked, axis=0)
+                stressed_returns = mean_return + (shocked - mean_return) * volatility_spike
                 
                 # Calculate stressed portfolio metrics
-                stressed_portfolio_returns = np.dot(stressed_returns.values, list(portfolio_weights.values()))
+                stressed_portfolio_returns = stressed_returns @ weights_arr
                 stressed_volatility = np.std(stressed_portfolio_returns) * np.sqrt(252)
                 stressed_var = np.percentile(stressed_portfolio_returns, confidence_level * 100)
                 stressed_cvar = np.mean(stressed_portfolio_returns[stressed_portfolio_returns <= stressed_var])
                 
                 # Calculate maximum drawdown
-                cumulative_returns = (1 + stressed_portfolio_returns).cumprod()
-                rolling_max = cumulative_returns.expanding().max()
+                cumulative_returns = np.cumprod(1 + stressed_portfolio_returns)
+                rolling_max = np.maximum.accumulate(cumulative_returns)
                 drawdown = (cumulative_returns - rolling_max) / rolling_max
                 max_drawdown = drawdown.min()
                 
@@ -1268,21 +1423,20 @@ class Toolkit:
                 cvar_loss = abs(stressed_cvar) * portfolio_value
                 max_loss = abs(max_drawdown) * portfolio_value
                 
-                # Individual ticker stress impact
+                # Individual ticker stress impact, annualized
+                return_impacts = np.nanmean(stressed_returns, axis=0) * 252
+                vol_impacts = np.nanstd(stressed_returns, axis=0, ddof=1) * np.sqrt(252)
                 ticker_impacts = {}
-                for ticker in tickers:
-                    if ticker in stressed_returns.columns:
-                        ticker_return_impact = stressed_returns[ticker].mean() * 252  # Annualized
-                        ticker_vol_impact = stressed_returns[ticker].std() * np.sqrt(252)
-                        position_value = portfolio_weights.get(ticker, 0) * portfolio_value
-                        
-                        ticker_impacts[ticker] = {
-                            "weight": round(portfolio_weights.get(ticker, 0), 4),
-                            "return_impact": round(ticker_return_impact, 4),
-                            "volatility_impact": round(ticker_vol_impact, 4),
-                            "position_value": round(position_value, 2),
-                            "estimated_loss": round(abs(ticker_return_impact) * position_value, 2)
-                        }
+                for ticker, ticker_return_impact, ticker_vol_impact in zip(columns, return_impacts, vol_impacts):
+                    position_value = portfolio_weights.get(ticker, 0) * portfolio_value
+                    
+                    ticker_impacts[ticker] = {
+                        "weight": round(portfolio_weights.get(ticker, 0), 4),
+                        "return_impact": round(ticker_return_impact, 4),
+                        "volatility_impact": round(ticker_vol_impact, 4),
+                        "position_value": round(position_value, 2),
+                        "estimated_loss": round(abs(ticker_return_impact) * position_value, 2)
+                    }
                 
                 stress_test_results[scenario_name] = {
                     "scenario_parameters": scenario,
@@ -1410,11 +1564,9 @@ class Toolkit:
             individual_betas = {}
             returns_data = {}
             
-            for ticker in tickers:
+            histories = _fetch_histories(tickers, start_date, end_date)
+            for ticker, hist in histories.items():
                 try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(start=start_date, end=end_date)
-                    
                     if len(hist) > 1:
                         stock_returns = hist['Close'].pct_change().dropna()
                         
@@ -1491,19 +1643,6 @@ class Toolkit:
             portfolio_excess_returns = portfolio_returns_series - portfolio_beta * aligned_benchmark
             portfolio_tracking_error = portfolio_excess_returns.std() * np.sqrt(252)
             
-            # Beta risk categories
-            def categorize_beta(beta_value):
-                if beta_value < 0.7:
-                    return "Low Beta (Defensive)"
-                elif beta_value < 0.85:
-                    return "Below Market"
-                elif beta_value < 1.15:
-                    return "Market Neutral"
-                elif beta_value < 1.3:
-                    return "Above Market"
-                else:
-                    return "High Beta (Aggressive)"
-            
             # Hedging recommendations based on beta
             hedging_needs = {}
             if portfolio_beta > 1.2:
@@ -1526,7 +1665,7 @@ class Toolkit:
                     "portfolio_beta": round(portfolio_beta, 4),
                     "portfolio_alpha": round(portfolio_alpha, 4),
                     "portfolio_tracking_error": round(portfolio_tracking_error, 4),
-                    "beta_category": categorize_beta(portfolio_beta),
+                    "beta_category": _BETA_CATEGORIES[bisect_right(_BETA_BREAKS, portfolio_beta)],
                     "benchmark": benchmark_ticker,
                     "analysis_period": f"{lookback_days} days",
                     "calculation_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -1619,11 +1758,9 @@ class Toolkit:
             current_prices = {}
             volatilities = {}
             
-            for ticker in tickers:
+            histories = _fetch_histories(tickers, start_date, end_date)
+            for ticker, hist in histories.items():
                 try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(start=start_date, end=end_date)
-                    
                     if len(hist) > 1:
                         returns = hist['Close'].pct_change().dropna()
                         returns_data[ticker] = returns
@@ -1649,10 +1786,9 @@ class Toolkit:
             # 1. Equity Index Hedging
             if "equity_index" in hedge_types:
                 # Calculate beta vs major indices for hedging
-                indices = {"SPY": "S&P 500", "QQQ": "NASDAQ", "IWM": "Russell 2000", "EFA": "International"}
                 index_hedges = {}
                 
-                for index_ticker, index_name in indices.items():
+                for index_ticker, index_name in _HEDGE_INDICES.items():
                     try:
                         index = yf.Ticker(index_ticker)
                         index_hist = index.history(start=start_date, end=end_date)
@@ -1708,46 +1844,19 @@ class Toolkit:
                         "recommendation": "High" if risk_tolerance < 0.3 else "Medium" if risk_tolerance < 0.7 else "Low"
                     }
                 
-                # Collar strategy
-                collar_strategy = {
-                    "strategy": "Collar (Buy Put, Sell Call)",
-                    "put_strike": "95% of portfolio value",
-                    "call_strike": "105% of portfolio value",
-                    "net_premium": "Near zero (premium neutral)",
-                    "max_upside": "5% above current value",
-                    "max_downside": "5% below current value"
-                }
-                
                 hedging_strategies["options_hedging"] = {
                     "strategy_type": "Options Protection",
                     "protective_puts": options_strategies,
-                    "collar_strategy": collar_strategy,
+                    "collar_strategy": _COLLAR_STRATEGY,
                     "implementation": "Use index options (SPX, QQQ) or individual stock options",
                     "timing_consideration": "Buy protection during low volatility periods"
                 }
             
             # 3. Cryptocurrency Hedging
             if "crypto" in hedge_types:
-                crypto_hedges = {
-                    "BTC": {
-                        "asset_name": "Bitcoin",
-                        "hedge_rationale": "Inflation hedge and currency debasement protection",
-                        "recommended_allocation": "2-5% of portfolio",
-                        "correlation_with_stocks": "Medium (0.3-0.6)",
-                        "volatility_profile": "Very High"
-                    },
-                    "ETH": {
-                        "asset_name": "Ethereum",
-                        "hedge_rationale": "Technology disruption and digital asset exposure",
-                        "recommended_allocation": "1-3% of portfolio",
-                        "correlation_with_stocks": "Medium-High (0.4-0.7)",
-                        "volatility_profile": "Very High"
-                    }
-                }
-                
                 hedging_strategies["crypto_hedging"] = {
                     "strategy_type": "Cryptocurrency Diversification",
-                    "crypto_allocations": crypto_hedges,
+                    "crypto_allocations": _CRYPTO_HEDGES,
                     "implementation": "ETFs (BITO, ETHE) or direct holdings via exchanges",
                     "risk_warning": "High volatility - limit exposure to small percentage",
                     "regulatory_risk": "Monitor regulatory developments"
@@ -1755,76 +1864,27 @@ class Toolkit:
             
             # 4. Commodities Hedging
             if "commodities" in hedge_types:
-                commodity_hedges = {
-                    "GLD": {
-                        "commodity": "Gold",
-                        "hedge_purpose": "Inflation and currency hedge",
-                        "recommended_allocation": "5-10% of portfolio",
-                        "implementation": "GLD ETF or futures"
-                    },
-                    "USO": {
-                        "commodity": "Oil",
-                        "hedge_purpose": "Energy inflation hedge",
-                        "recommended_allocation": "2-5% of portfolio",
-                        "implementation": "USO ETF or oil futures"
-                    },
-                    "DBA": {
-                        "commodity": "Agricultural",
-                        "hedge_purpose": "Food inflation hedge",
-                        "recommended_allocation": "2-3% of portfolio",
-                        "implementation": "DBA ETF or agricultural futures"
-                    }
-                }
-                
                 hedging_strategies["commodities_hedging"] = {
                     "strategy_type": "Commodity Inflation Protection",
-                    "commodity_allocations": commodity_hedges,
+                    "commodity_allocations": _COMMODITY_HEDGES,
                     "total_recommended_allocation": "9-18% of portfolio",
                     "rebalancing_frequency": "Quarterly"
                 }
             
             # 5. Forex Hedging
             if "forex" in hedge_types:
-                forex_hedges = {
-                    "USD_strength": {
-                        "scenario": "USD Strengthening",
-                        "impact_on_portfolio": "Negative for international stocks",
-                        "hedge": "Long USD index (DXY) or short foreign currency ETFs"
-                    },
-                    "USD_weakness": {
-                        "scenario": "USD Weakening",
-                        "impact_on_portfolio": "Positive for international stocks",
-                        "hedge": "Foreign currency ETFs (FXE, FXY) or international bonds"
-                    }
-                }
-                
                 hedging_strategies["forex_hedging"] = {
                     "strategy_type": "Currency Risk Management",
-                    "currency_scenarios": forex_hedges,
+                    "currency_scenarios": _FOREX_HEDGES,
                     "implementation": "Currency ETFs or forex futures",
                     "monitoring": "Watch DXY and major currency pairs"
                 }
             
             # 6. Volatility Hedging
             if "volatility" in hedge_types:
-                vol_hedges = {
-                    "VIX_protection": {
-                        "instrument": "VIX ETFs (VXX, UVXY)",
-                        "purpose": "Profit from volatility spikes",
-                        "allocation": "1-2% of portfolio",
-                        "timing": "Buy during low volatility periods"
-                    },
-                    "long_vol_strategies": {
-                        "instrument": "Long volatility options strategies",
-                        "purpose": "Tail risk protection",
-                        "cost": "1-3% annually",
-                        "effectiveness": "High during market crashes"
-                    }
-                }
-                
                 hedging_strategies["volatility_hedging"] = {
                     "strategy_type": "Volatility Protection",
-                    "volatility_instruments": vol_hedges,
+                    "volatility_instruments": _VOL_HEDGES,
                     "current_vix_level": "Monitor VIX levels for entry timing",
                     "warning": "VIX products have contango decay - use sparingly"
                 }
@@ -1833,15 +1893,7 @@ class Toolkit:
             estimated_annual_cost = portfolio_value * 0.015  # Rough estimate: 1.5% annually
             
             # Risk-adjusted recommendations
-            if risk_tolerance < 0.3:
-                urgency = "High - Implement comprehensive hedging immediately"
-                hedge_coverage = "80-100% of portfolio value"
-            elif risk_tolerance < 0.7:
-                urgency = "Medium - Gradual hedging implementation"
-                hedge_coverage = "50-80% of portfolio value"
-            else:
-                urgency = "Low - Selective hedging for tail risks only"
-                hedge_coverage = "20-50% of portfolio value"
+            urgency, hedge_coverage = _HEDGE_PLANS[bisect_right(_RISK_TOLERANCE_BREAKS, risk_tolerance)]
             
             return {
                 "portfolio_analysis": {
@@ -2,6 +2,21 @@
 Utility functions for managing debate state and count incrementing.
 """
 
+import json
+import re
+
+# Contents of a ```json ... ``` (or bare ```) fenced block
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Keywords the agents look for in LLM responses. The lookahead makes every
+# position a candidate, so overlapping keywords match exactly like
+# `keyword in text.upper()` would, but in a single pass over the text.
+_RESPONSE_KEYWORDS_RE = re.compile(
+    r"(?=(BUY|SELL|CONFIDENCE|HIGH|MEDIUM|LOW|RISK|CRITICAL|FUNDAMENTAL|TECHNICAL"
+    r"|NEWS|SENTIMENT|COMPANY|SPECIFIC|LIQUIDITY|REGULATORY|VOLATILITY))",
+    re.IGNORECASE,
+)
+
 def increment_debate_count(state: dict) -> dict:
     """
     Increment the debate count in the investment_debate_state.
@@ -43,4 +58,105 @@ def get_debate_round_info(state: dict) -> dict:
         "step": step_in_round,
         "total_steps": count,
         "step_name": ["Bull", "Bear", "Bull Cross", "Bear Cross"][step_in_round]
-    } 
\ No newline at end of file
+    } 
+
+
+def append_json_list(encoded: str, item) -> str:
+    """
+    Append an item to a JSON-encoded list without decoding the list.
+
+    The debate histories are JSON arrays kept as strings in the state and
+    grow by one entry per turn, so the new item is spliced in rather than
+    the whole history being parsed and re-encoded. The output matches
+    json.dumps of the appended list.
+
+    Args:
+        encoded: A list previously encoded with json.dumps
+        item: The entry to append
+
+    Returns:
+        The encoded list with the item appended, or a one-item list if
+        encoded is empty or not a JSON array
+    """
+    if isinstance(encoded, str):
+        body = encoded.strip()
+        if body.startswith("[") and body.endswith("]"):
+            inner = body[1:-1].strip()
+            separator = ", " if inner else ""
+            return f"[{inner}{separator}{json.dumps(item)}]"
+    return json.dumps([item])
+
+
+def parse_json_object(text: str) -> dict:
+    """
+    Parse the JSON object out of an LLM response.
+
+    Tolerates markdown code fences and prose around the object instead of
+    discarding the whole response when it is not bare JSON.
+
+    Args:
+        text: Raw LLM response content
+
+    Returns:
+        The parsed object, or an empty dict if none could be parsed
+    """
+    if not text or not isinstance(text, str):
+        return {}
+    try:
+        parsed = json.loads(text)
+        return parsed if isinstance(parsed, dict) else {}
+    except json.JSONDecodeError:
+        pass
+
+    fenced = _JSON_FENCE_RE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        parsed = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def scan_keywords(text: str) -> frozenset:
+    """
+    Collect the response keywords that appear anywhere in an LLM response.
+
+    Args:
+        text: Raw LLM response content
+
+    Returns:
+        Upper-cased keywords found in the text, for `"HIGH" in keywords` checks
+    """
+    if not text:
+        return frozenset()
+    return frozenset(m.group(1).upper() for m in _RESPONSE_KEYWORDS_RE.finditer(text))
+
+
+def extract_recommendation(report: str) -> tuple:
+    """
+    Derive an analyst's recommendation and confidence from its report text.
+
+    Args:
+        report: Final analyst report (empty when the model requested tools)
+
+    Returns:
+        (recommendation, confidence), e.g. ("Bullish", "High"); a report
+        without BUY/SELL or HIGH/LOW CONFIDENCE keywords is ("Neutral", "Medium")
+    """
+    keywords = scan_keywords(report)
+    recommendation = "Neutral"
+    if "BUY" in keywords:
+        recommendation = "Bullish"
+    elif "SELL" in keywords:
+        recommendation = "Bearish"
+    confidence = "Medium"
+    if "CONFIDENCE" in keywords:
+        if "HIGH" in keywords:
+            confidence = "High"
+        elif "LOW" in keywords:
+            confidence = "Low"
+    return recommendation, confidence
@@ -2,6 +2,12 @@ import chromadb
 from chromadb.config import Settings
 from openai import OpenAI
 
+# (backend_url, model, text) -> embedding, shared by every memory instance. Each
+# manager/researcher embeds the same four analyst reports as its situation, so
+# one propagate would otherwise send the identical text to the API many times.
+_EMBEDDING_CACHE = {}
+_EMBEDDING_CACHE_MAX = 256
+
 
 class FinancialSituationMemory:
     def __init__(self, name, config):
@@ -9,17 +15,35 @@ class FinancialSituationMemory:
             self.embedding = "nomic-embed-text"
         else:
             self.embedding = "text-embedding-3-small"
-        self.client = OpenAI(base_url=config["backend_url"])
+        self.backend_url = config["backend_url"]
+        self.client = OpenAI(base_url=self.backend_url)
         self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.create_collection(name=name)
+        # get_or_create keeps construction idempotent: in-process chromadb clients
+        # share one namespace, so a second graph in the same process (e.g.
+        # repeated eval or notebook runs) would otherwise fail on the name. That
+        # second graph reuses the collection and inherits the first one's memories.
+        self.situation_collection = self.chroma_client.get_or_create_collection(name=name)
 
     def get_embedding(self, text):
         """Get OpenAI embedding for a text"""
-        
-        response = self.client.embeddings.create(
-            model=self.embedding, input=text
-        )
-        return response.data[0].embedding
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts):
+        """Get OpenAI embeddings for several texts, requesting all uncached ones in one call"""
+        keys = [(self.backend_url, self.embedding, text) for text in texts]
+        found = {key: _EMBEDDING_CACHE[key] for key in keys if key in _EMBEDDING_CACHE}
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+
+        if missing:
+            response = self.client.embeddings.create(
+                model=self.embedding, input=[key[2] for key in missing]
+            )
+            if len(_EMBEDDING_CACHE) + len(missing) > _EMBEDDING_CACHE_MAX:
+                _EMBEDDING_CACHE.clear()
+            for key, item in zip(missing, response.data):
+                found[key] = _EMBEDDING_CACHE[key] = item.embedding
+
+        return [found[key] for key in keys]
 
     def add_situations(self, situations_and_advice):
         """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
@@ -27,7 +51,6 @@ class FinancialSituationMemory:
         situations = []
         advice = []
         ids = []
-        embeddings = []
 
         offset = self.situation_collection.count()
 
@@ -35,7 +58,9 @@ class FinancialSituationMemory:
             situations.append(situation)
             advice.append(recommendation)
             ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
+
+        # One embeddings request for the whole batch instead of one per situation
+        embeddings = self.get_embeddings(situations)
 
         self.situation_collection.add(
             documents=situations,
@@ -46,6 +71,11 @@ class FinancialSituationMemory:
 
     def get_memories(self, current_situation, n_matches=1):
         """Find matching recommendations using OpenAI embeddings"""
+        # Nothing has been reflected into this memory yet (every role's memory
+        # on a fresh run), so skip the embeddings request and the query
+        if self.situation_collection.count() == 0:
+            return []
+
         query_embedding = self.get_embedding(current_situation)
 
         results = self.situation_collection.query(
@@ -9,6 +9,7 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
 from tradingagents.blackboard import create_agent_blackboard
+from tradingagents.agents.utils.debate_utils import scan_keywords
 
 
 def create_fundamentals_analyst_with_blackboard(llm, toolkit):
@@ -109,15 +110,17 @@ def create_fundamentals_analyst_with_blackboard(llm, toolkit):
             # Simple extraction of recommendation and confidence
             recommendation = "Neutral"
             confidence = "Medium"
+            # One pass over the report instead of an upper-cased copy per check
+            report_keywords = scan_keywords(report)
             
-            if "BUY" in report.upper():
+            if "BUY" in report_keywords:
                 recommendation = "Bullish"
-            elif "SELL" in report.upper():
+            elif "SELL" in report_keywords:
                 recommendation = "Bearish"
             
-            if "HIGH" in report.upper() and "CONFIDENCE" in report.upper():
+            if "HIGH" in report_keywords and "CONFIDENCE" in report_keywords:
                 confidence = "High"
-            elif "LOW" in report.upper() and "CONFIDENCE" in report.upper():
+            elif "LOW" in report_keywords and "CONFIDENCE" in report_keywords:
                 confidence = "Low"
             
             # Post analysis to blackboard
@@ -220,9 +223,10 @@ def create_trader_with_blackboard(llm, toolkit):
         decision = "HOLD"
         reasoning = result.content
         
-        if "BUY" in result.content.upper():
+        response_keywords = scan_keywords(result.content)
+        if "BUY" in response_keywords:
             decision = "BUY"
-        elif "SELL" in result.content.upper():
+        elif "SELL" in response_keywords:
             decision = "SELL"
         
         # Post final trading decision to blackboard
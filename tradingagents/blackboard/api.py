@@ -104,7 +104,7 @@ async def create_message(message_request: MessageCreateRequest):
     )
     
     # Write to storage
-    write_message(message.dict())
+    write_message(message)
     
     return message
 
@@ -4,34 +4,54 @@ Storage functions for the blackboard communication system.
 
 import json
 import os
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 from pathlib import Path
 
+from pydantic import BaseModel
+
 
 # Default blackboard log file
 BLACKBOARD_LOG_FILE = "blackboard_logs.jsonl"
 
+# Messages parsed so far from the append-only log, so each read only decodes
+# the lines written since the previous one. Keyed by the file's identity plus
+# its leading bytes ("head"): a cleared log recreated on a reused inode starts
+# with different content, so a cleared, replaced or truncated log is parsed
+# again from the start. "by_type" indexes the same message dicts by their
+# "type" field.
+_PARSED_LOG = {"identity": None, "head": b"", "offset": 0, "messages": [], "by_type": {}}
+_PARSED_LOG_LOCK = threading.Lock()
+
+# Bytes of the log's start kept in the cache identity and re-checked on each read
+_HEAD_BYTES = 4096
 
-def write_message(message: Dict[str, Any]) -> None:
+
+def write_message(message: Union[BaseModel, Dict[str, Any]]) -> None:
     """
     Append a message to the blackboard log file.
     
     Args:
-        message: Dictionary representation of a BlackboardMessage
+        message: A BlackboardMessage, or its dictionary representation
     """
-    # Ensure the message has a timestamp if not provided
-    if "timestamp" not in message:
-        message["timestamp"] = datetime.utcnow().isoformat()
-    
-    # Convert datetime objects to ISO format for JSON serialization
-    if isinstance(message["timestamp"], datetime):
-        message["timestamp"] = message["timestamp"].isoformat()
-    
-    # Write to JSONL file (one JSON object per line)
+    if isinstance(message, BaseModel):
+        # pydantic serializes the model (datetimes included) in one native
+        # call, skipping the model_dump() -> dict -> json.dumps round-trip
+        line = message.model_dump_json()
+    else:
+        # Ensure the message has a timestamp if not provided
+        if "timestamp" not in message:
+            message["timestamp"] = datetime.utcnow().isoformat()
+        
+        # Convert datetime objects to ISO format for JSON serialization
+        if isinstance(message["timestamp"], datetime):
+            message["timestamp"] = message["timestamp"].isoformat()
+        line = json.dumps(message, ensure_ascii=False)
+    
+    # Write to JSONL file (one JSON object per line) in a single call
     with open(BLACKBOARD_LOG_FILE, "a", encoding="utf-8") as f:
-        json.dump(message, f, ensure_ascii=False)
-        f.write("\n")
+        f.write(line + "\n")
 
 
 def read_messages(filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
@@ -51,28 +71,77 @@ def read_messages(filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, An
                 - 'timestamp_before': Filter messages before this timestamp (ISO format)
     
     Returns:
-        List of message dictionaries that match the filters
+        List of message dictionaries that match the filters. The dictionaries
+        are shared with the parse cache and must be treated as read-only.
     """
-    if not os.path.exists(BLACKBOARD_LOG_FILE):
-        return []
+    if filters and "type" in filters:
+        # Start from the messages of that type instead of scanning the whole log
+        messages = _load_messages(filters["type"])
+        filters = {key: value for key, value in filters.items() if key != "type"}
+    else:
+        messages = _load_messages()
+    if not filters:
+        return list(messages)
+    return [message for message in messages if _matches_filters(message, filters)]
+
+
+def _load_messages(message_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Return messages in the log, parsing only lines appended since the last call.
     
-    messages = []
+    Args:
+        message_type: Optional message type; only messages of this type are returned
     
-    with open(BLACKBOARD_LOG_FILE, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            
-            try:
-                message = json.loads(line)
-                if _matches_filters(message, filters):
-                    messages.append(message)
-            except json.JSONDecodeError:
-                # Skip malformed lines
-                continue
+    Returns:
+        The cached list of parsed messages (do not mutate)
+    """
+    try:
+        f = open(BLACKBOARD_LOG_FILE, "rb")
+    except FileNotFoundError:
+        _reset_parsed_log()
+        return []
     
-    return messages
+    with f, _PARSED_LOG_LOCK:
+        # fstat the open handle so the identity and the bytes read belong to the same file
+        st = os.fstat(f.fileno())
+        identity = (os.path.abspath(BLACKBOARD_LOG_FILE), st.st_dev, st.st_ino)
+        head = _PARSED_LOG["head"]
+        if (_PARSED_LOG["identity"] != identity
+                or st.st_size < _PARSED_LOG["offset"]
+                or f.read(len(head)) != head):
+            _PARSED_LOG.update(identity=identity, head=b"", offset=0, messages=[], by_type={})
+        
+        if st.st_size > _PARSED_LOG["offset"]:
+            f.seek(_PARSED_LOG["offset"])
+            chunk = f.read(st.st_size - _PARSED_LOG["offset"])
+            # A line still being appended by another writer is left for the next read
+            complete = chunk.rfind(b"\n") + 1
+            for line in chunk[:complete].splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    message = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    # Skip malformed lines
+                    continue
+                _PARSED_LOG["messages"].append(message)
+                if isinstance(message, dict) and "type" in message:
+                    _PARSED_LOG["by_type"].setdefault(message.get("type"), []).append(message)
+            _PARSED_LOG["offset"] += complete
+            if len(_PARSED_LOG["head"]) < min(_PARSED_LOG["offset"], _HEAD_BYTES):
+                f.seek(0)
+                _PARSED_LOG["head"] = f.read(min(_PARSED_LOG["offset"], _HEAD_BYTES))
+        
+        if message_type is None:
+            return _PARSED_LOG["messages"]
+        return _PARSED_LOG["by_type"].get(message_type, [])
+
+
+def _reset_parsed_log() -> None:
+    """Drop the parsed-message cache."""
+    with _PARSED_LOG_LOCK:
+        _PARSED_LOG.update(identity=None, head=b"", offset=0, messages=[], by_type={})
 
 
 def _matches_filters(message: Dict[str, Any], filters: Optional[Dict[str, Any]]) -> bool:
@@ -128,6 +197,7 @@ def clear_blackboard() -> None:
     """
     if os.path.exists(BLACKBOARD_LOG_FILE):
         os.remove(BLACKBOARD_LOG_FILE)
+    _reset_parsed_log()
 
 
 def get_blackboard_stats() -> Dict[str, Any]:
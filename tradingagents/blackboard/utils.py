@@ -2,6 +2,7 @@
 Utility functions for agents to easily interact with the blackboard system.
 """
 
+import functools
 import uuid
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
@@ -17,6 +18,10 @@ class BlackboardAgent:
     This class provides convenient methods for agents to post messages
     and read messages from other agents.
     """
+
+    # Only identity fields; create_agent_blackboard shares one instance per
+    # (agent_id, agent_role), and every post reads self.sender
+    __slots__ = ("agent_id", "agent_role", "sender")
     
     def __init__(self, agent_id: str, agent_role: str):
         """
@@ -60,7 +65,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_trade_proposal(self, ticker: str, action: str, quantity: int, 
@@ -97,7 +102,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_debate_comment(self, topic: str, position: str, argument: str, 
@@ -132,7 +137,7 @@ class BlackboardAgent:
             reply_to=reply_to
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_risk_alert(self, ticker: str, risk_level: str, risk_factors: List[str], 
@@ -167,7 +172,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_investment_decision(self, ticker: str, decision: str, reasoning: str, 
@@ -202,7 +207,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_risk_assessment(self, ticker: str, risk_level: str, risk_factors: List[str], 
@@ -240,7 +245,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_debate_summary(self, ticker: str, debate_type: str, summary: str, 
@@ -278,7 +283,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_research_argument(self, ticker: str, position: str, argument: str, 
@@ -318,7 +323,7 @@ class BlackboardAgent:
             reply_to=reply_to
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_risk_debate_comment(self, topic: str, stance: str, argument: str, 
@@ -356,7 +361,7 @@ class BlackboardAgent:
             reply_to=reply_to
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_risk_position(self, ticker: str, stance: str, confidence: str, 
@@ -394,7 +399,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_risk_recommendation(self, ticker: str, stance: str, actions: List[str], 
@@ -432,7 +437,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_trade_decision(self, ticker: str, action: str, confidence: str, 
@@ -467,7 +472,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_trade_execution(self, ticker: str, action: str, quantity: int, 
@@ -509,7 +514,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_portfolio_update(self, ticker: str, position_size: int, 
@@ -546,7 +551,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_trade_analysis(self, ticker: str, market_conditions: str, 
@@ -584,7 +589,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_request(self, request_type: str, content: Dict[str, Any], 
@@ -610,7 +615,7 @@ class BlackboardAgent:
             content=content
         )
         
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def post_research_summary(
@@ -668,7 +673,7 @@ class BlackboardAgent:
             reply_to=reply_to
         )
 
-        write_message(message.model_dump())
+        write_message(message)
         return message.message_id
     
     def get_analysis_reports(self, ticker: Optional[str] = None, 
@@ -1131,9 +1136,13 @@ class BlackboardAgent:
         return read_messages(filters)
 
 
+@functools.lru_cache(maxsize=None)
 def create_agent_blackboard(agent_id: str, agent_role: str) -> BlackboardAgent:
     """
     Create a BlackboardAgent instance for easy integration.
+
+    BlackboardAgent only carries its sender identity, so one instance per
+    (agent_id, agent_role) is shared across node calls and threads.
     
     Args:
         agent_id: Unique identifier for the agent
@@ -1,5 +1,6 @@
 import tradingagents.default_config as default_config
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 # Use default config but allow it to be overridden
 _config: Optional[Dict] = None
@@ -23,11 +24,16 @@ def set_config(config: Dict):
     DATA_DIR = _config["data_dir"]
 
 
-def get_config() -> Dict:
-    """Get the current configuration."""
+def get_config() -> Mapping:
+    """Get the current configuration as a read-only view.
+
+    Dataflow helpers call this on every tool invocation and only read from
+    it, so a proxy avoids copying the dict each time while still keeping
+    callers from mutating the shared config; use set_config to change it.
+    """
     if _config is None:
         initialize_config()
-    return _config.copy()
+    return MappingProxyType(_config)
 
 
 # Initialize with default config
@@ -7,7 +7,9 @@ from .finnhub_utils import get_data_in_range
 from dateutil.relativedelta import relativedelta
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import json
+import logging
 import os
 import pandas as pd
 from tqdm import tqdm
@@ -15,6 +17,28 @@ import yfinance as yf
 from openai import OpenAI
 from .config import get_config, set_config, DATA_DIR
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _load_close_prices(ticker: str) -> Dict[str, float]:
+    """Parse a ticker's price CSV once and return {yyyy-mm-dd: close}."""
+    price_path = os.path.join(
+        os.path.dirname(__file__),
+        "../../data/market_data/price_data",
+        f"{ticker}-YFin-data-2015-01-01-2025-07-27.csv",
+    )
+    if not os.path.exists(price_path):
+        raise Exception(f"Price data file not found for {ticker}")
+
+    df = pd.read_csv(price_path, usecols=["Date", "Close"])
+    closes = {}
+    # Keep the first row per day (ignore time part), matching the old prefix scan
+    for day, close in zip(df["Date"].astype(str).str[:10], df["Close"]):
+        closes.setdefault(day, float(close))
+    return closes
+
+
 def get_price_from_csv(
     ticker: str,
     date: str,
@@ -30,23 +54,11 @@ def get_price_from_csv(
         Exception: If price or file not found
     """
 
-    # Path to price data CSV
-    price_path = os.path.join(
-        os.path.dirname(__file__),
-        "../../data/market_data/price_data",
-        f"{ticker.upper()}-YFin-data-2015-01-01-2025-07-27.csv",
-    )
-    if not os.path.exists(price_path):
-        raise Exception(f"Price data file not found for {ticker}")
-
-    df = pd.read_csv(price_path)
-    # Normalize date format
-    date_str = date.strip()
-    # Find row with matching date (ignore time part)
-    row = df[df["Date"].str.startswith(date_str)]
-    if row.empty:
+    # Each ticker's CSV is parsed once per process and reused across dates
+    closes = _load_close_prices(ticker.upper())
+    price = closes.get(date.strip())
+    if price is None:
         raise Exception(f"No price found for {ticker} on {date}")
-    price = float(row.iloc[0]["Close"])
     return price
 
 def get_finnhub_news(
@@ -136,7 +148,7 @@ def get_finnhub_company_insider_sentiment(
     seen_dicts = []
     config = get_config()
     if config["abmrOffline"]:
-        print(data)
+        logger.debug("Offline insider sentiment payload: %s", data)
         for entry in data["data"]:
             if entry not in seen_dicts:
                 result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
@@ -289,7 +301,7 @@ def get_simfin_balance_sheet(
     """
     base_dir = os.path.join(DATA_DIR, "simfin_data")
     if not os.path.isdir(base_dir):
-        print(f"SimFin JSON directory not found: {base_dir}")
+        logger.warning("SimFin JSON directory not found: %s", base_dir)
         return ""
 
     curr_dt = pd.to_datetime(curr_date, utc=True).normalize()
@@ -341,7 +353,7 @@ def get_simfin_balance_sheet(
             if isinstance(data, list) and data:
                 return data[0]  # assume single record per file (as per example)
         except Exception as e:
-            print(f"Error reading {path}: {e}")
+            logger.warning("Error reading %s: %s", path, e)
         return None
 
     # Determine target quarter end(s)
@@ -397,7 +409,7 @@ def get_simfin_balance_sheet(
             attempts += 1
 
     if chosen_record is None:
-        print("No suitable balance sheet found within lookback limit.")
+        logger.warning("No suitable balance sheet found within lookback limit.")
         return ""
 
     # Format output (keep prior style)
@@ -449,7 +461,7 @@ def get_simfin_cashflow(
     """
     base_dir = os.path.join(DATA_DIR, "simfin_data")
     if not os.path.isdir(base_dir):
-        print(f"SimFin JSON directory not found: {base_dir}")
+        logger.warning("SimFin JSON directory not found: %s", base_dir)
         return ""
 
     curr_dt = pd.to_datetime(curr_date, utc=True).normalize()
@@ -490,7 +502,7 @@ def get_simfin_cashflow(
             if isinstance(data, list) and data:
                 return data[0]
         except Exception as e:
-            print(f"Error reading {path}: {e}")
+            logger.warning("Error reading %s: %s", path, e)
         return None
 
     # Determine initial target quarter end
@@ -532,7 +544,7 @@ def get_simfin_cashflow(
             attempts += 1
 
     if chosen_record is None:
-        print("No suitable cash flow statement found within lookback limit.")
+        logger.warning("No suitable cash flow statement found within lookback limit.")
         return ""
 
     publish_date_str = str(chosen_record.get("Publish Date"))[:10]
@@ -581,7 +593,7 @@ def get_simfin_income_statements(
     """
     base_dir = os.path.join(DATA_DIR, "simfin_data")
     if not os.path.isdir(base_dir):
-        print(f"SimFin JSON directory not found: {base_dir}")
+        logger.warning("SimFin JSON directory not found: %s", base_dir)
         return ""
 
     curr_dt = pd.to_datetime(curr_date, utc=True).normalize()
@@ -626,7 +638,7 @@ def get_simfin_income_statements(
             if isinstance(data, list) and data:
                 return data[0]  # assume single record per file
         except Exception as e:
-            print(f"Error reading {path}: {e}")
+            logger.warning("Error reading %s: %s", path, e)
         return None
 
     # Determine initial target quarter end
@@ -674,7 +686,7 @@ def get_simfin_income_statements(
             attempts += 1
 
     if chosen_record is None:
-        print("No suitable income statement found within lookback limit.")
+        logger.warning("No suitable income statement found within lookback limit.")
         return ""
 
     publish_date_str = str(chosen_record.get("Publish Date"))[:10]
@@ -734,19 +746,19 @@ def get_reddit_global_news(
     file_path = os.path.join(DATA_DIR, "perplexity_macro_news", file_name)
 
     if not os.path.exists(file_path):
-        print(f"Macro news file not found: {file_path}")
+        logger.warning("Macro news file not found: %s", file_path)
         return ""
 
     try:
         with open(file_path, "r", encoding="utf-8") as fh:
             data = json.load(fh)
     except Exception as e:
-        print(f"Error reading macro news file {file_path}: {e}")
+        logger.warning("Error reading macro news file %s: %s", file_path, e)
         return ""
 
     cleaned = data.get("cleanedOutput")
     if not cleaned:
-        print(f"'cleanedOutput' field missing or empty in {file_path}")
+        logger.warning("'cleanedOutput' field missing or empty in %s", file_path)
         return ""
 
     return cleaned
@@ -822,6 +834,19 @@ def get_reddit_company_news(
     return f"## {ticker_u} News Reddit, from {before_str} to {start_date}:\n\n{news_str}"
 
 
+@lru_cache(maxsize=None)
+def _offline_trading_days(symbol: str) -> frozenset:
+    """Trading days (yyyy-mm-dd) covered by a symbol's offline price CSV."""
+    data = pd.read_csv(
+        os.path.join(
+            DATA_DIR,
+            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-07-27.csv",
+        ),  # type: ignore
+        usecols=["Date"],
+    )
+    return frozenset(pd.to_datetime(data["Date"], utc=True).astype(str).str[:10])
+
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -915,21 +940,12 @@ def get_stock_stats_indicators_window(
     before = curr_date - relativedelta(days=look_back_days)
 
     if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-07-27.csv",
-            )  # type: ignore
-        )
-        # print("Successfully fetched data")
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
+        trading_days = _offline_trading_days(symbol)
 
         ind_string = ""
         while curr_date >= before:
             # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
+            if curr_date.strftime("%Y-%m-%d") in trading_days:
                 indicator_value = get_stockstats_indicator(
                     symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
                 )
@@ -980,8 +996,8 @@ def get_stockstats_indicator(
             online=online,
         )
     except Exception as e:
-        print(
-            f"Error getting stockstats indicator data for indicator {indicator} on {curr_date}: {e}"
+        logger.warning(
+            "Error getting stockstats indicator data for indicator %s on %s: %s", indicator, curr_date, e
         )
         return ""
 
@@ -3,9 +3,42 @@ import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
 import os
+import threading
+from functools import lru_cache
 from .config import get_config
 
 
+@lru_cache(maxsize=16)
+def _load_offline_stock_stats(path: str):
+    """Parse an offline price CSV once and keep the wrapped frame for reuse.
+
+    Indicator windows query one date at a time, so without this every day in
+    the window re-read the full history and recomputed the indicator from
+    scratch. stockstats stores computed indicators as columns, so later
+    lookups on the shared frame are plain column reads.
+
+    Returns the frame with the lock that must be held while computing or
+    reading indicators on it: the tool node runs indicator calls in parallel
+    threads, and adding columns to one pandas frame concurrently is unsafe.
+    """
+    return wrap(pd.read_csv(path)), threading.Lock()
+
+
+@lru_cache(maxsize=16)
+def _load_online_stock_stats(path: str):
+    """Parse a downloaded price CSV once, with dates formatted for lookups.
+
+    The file name carries the download date, so a new day's data gets a new
+    cache entry while the windowed lookups of one day share a single frame.
+    Like the offline loader, returns the frame with its indicator lock.
+    """
+    data = pd.read_csv(path)
+    data["Date"] = pd.to_datetime(data["Date"])
+    df = wrap(data)
+    df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
+    return df, threading.Lock()
+
+
 class StockstatsUtils:
     @staticmethod
     def get_stock_stats(
@@ -31,13 +64,12 @@ class StockstatsUtils:
         if not online:
             try:
                 # print("Using offline tools to fetch data...")
-                data = pd.read_csv(
+                df, frame_lock = _load_offline_stock_stats(
                     os.path.join(
                         data_dir,
                         f"{symbol}-YFin-data-2015-01-01-2025-07-27.csv",
                     )
                 )
-                df = wrap(data)
             except FileNotFoundError:
                 raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
         else:
@@ -59,10 +91,7 @@ class StockstatsUtils:
                 f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
             )
 
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
+            if not os.path.exists(data_file):
                 data = yf.download(
                     symbol,
                     start=start_date,
@@ -74,15 +103,15 @@ class StockstatsUtils:
                 data = data.reset_index() # type: ignore
                 data.to_csv(data_file, index=False)
 
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
+            df, frame_lock = _load_online_stock_stats(data_file)
             curr_date = curr_date.strftime("%Y-%m-%d") # type: ignore
 
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+        with frame_lock:
+            df[indicator]  # trigger stockstats to calculate the indicator
+            matching_rows = df[df["Date"].str.startswith(curr_date)]
 
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
-            return indicator_value
-        else:
-            return "N/A: Not a trading day (weekend or holiday)"
+            if not matching_rows.empty:
+                indicator_value = matching_rows[indicator].values[0]
+                return indicator_value
+            else:
+                return "N/A: Not a trading day (weekend or holiday)"
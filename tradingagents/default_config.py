@@ -16,6 +16,13 @@ DEFAULT_CONFIG = {
     "deep_think_llm": "gpt-4.1-nano",
     "quick_think_llm": "gpt-4o-mini",
     "backend_url": "https://api.openai.com/v1",
+    # Optional SQLite file that caches LLM responses by prompt; None disables it.
+    # Prompts embed the ticker, date and blackboard context, so re-running an
+    # identical analysis is answered from this file without an LLM call.
+    "llm_cache_path": os.getenv("TRADINGAGENTS_LLM_CACHE"),
+    # Optional cap on LLM requests per second, shared by the quick and deep
+    # clients; None sends requests as fast as they are issued
+    "llm_requests_per_second": None,
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
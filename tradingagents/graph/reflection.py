@@ -1,8 +1,10 @@
 # TradingAgents/graph/reflection.py
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from langchain_openai import ChatOpenAI
 
+from tradingagents.agents.utils.debate_utils import parse_json_object
+
 
 class Reflector:
     """Handles reflection on decisions and updating memory."""
@@ -55,20 +57,92 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
 
         return f"{curr_market_report}\n\n{curr_sentiment_report}\n\n{curr_news_report}\n\n{curr_fundamentals_report}"
 
+    def _decisions(self, current_state: Dict[str, Any]) -> Dict[str, str]:
+        """Map each reflected role to the decision text it produced."""
+        return {
+            "bull_researcher": current_state["investment_debate_state"]["bull_history"],
+            "bear_researcher": current_state["investment_debate_state"]["bear_history"],
+            "trader": current_state["trader_investment_plan"],
+            "invest_judge": current_state["investment_debate_state"]["judge_decision"],
+            "risk_manager": current_state["risk_debate_state"]["judge_decision"],
+        }
+
+    def _component_messages(self, report: str, situation: str, returns_losses) -> list:
+        """Build the reflection prompt for one component."""
+        return [
+            ("system", self.reflection_system_prompt),
+            (
+                "human",
+                f"Returns: {returns_losses}\n\nAnalysis/Decision: {report}\n\nObjective Market Reports for Reference: {situation}",
+            ),
+        ]
+
     def _reflect_on_component(
         self, component_type: str, report: str, situation: str, returns_losses
     ) -> str:
         """Generate reflection for a component."""
+        messages = self._component_messages(report, situation, returns_losses)
+
+        result = self.quick_thinking_llm.invoke(messages).content
+        return result
+
+    def reflect_each(
+        self, current_state, returns_losses
+    ) -> Tuple[str, Dict[str, str]]:
+        """Reflect on every role's decision with one prompt per role.
+
+        The prompts are submitted together through the runnable batch API,
+        which fans them out concurrently over the client's shared connection
+        pool instead of paying one round trip after another.
+
+        Returns:
+            (situation, {role: reflection})
+        """
+        situation = self._extract_current_situation(current_state)
+        decisions = self._decisions(current_state)
+        results = self.quick_thinking_llm.batch(
+            [
+                self._component_messages(report, situation, returns_losses)
+                for report in decisions.values()
+            ],
+            config={"max_concurrency": len(decisions)},
+        )
+        return situation, {
+            role: result.content for role, result in zip(decisions, results)
+        }
+
+    def reflect_all(
+        self, current_state, returns_losses
+    ) -> Optional[Tuple[str, Dict[str, str]]]:
+        """Reflect on every role's decision with a single LLM call.
+
+        The system prompt and market situation are shared by all five
+        reflections, so they are sent once and the model returns one JSON
+        object keyed by role.
+
+        Returns:
+            (situation, {role: reflection}) or None if the response could not
+            be parsed, in which case callers should fall back to reflect_each.
+        """
+        situation = self._extract_current_situation(current_state)
+        decisions = self._decisions(current_state)
+        decisions_text = "\n\n".join(
+            f"Analysis/Decision ({role}): {report}" for role, report in decisions.items()
+        )
         messages = [
             ("system", self.reflection_system_prompt),
             (
                 "human",
-                f"Returns: {returns_losses}\n\nAnalysis/Decision: {report}\n\nObjective Market Reports for Reference: {situation}",
+                f"Returns: {returns_losses}\n\n{decisions_text}\n\nObjective Market Reports for Reference: {situation}"
+                f"\n\nReflect on each decision separately. Respond ONLY with a valid JSON object whose keys are "
+                f"{', '.join(decisions)} and whose values are your full reflection on that decision as a string.",
             ),
         ]
 
-        result = self.quick_thinking_llm.invoke(messages).content
-        return result
+        parsed = parse_json_object(self.quick_thinking_llm.invoke(messages).content)
+        if not all(isinstance(parsed.get(role), str) for role in decisions):
+            return None
+        return situation, {role: parsed[role] for role in decisions}
 
     def reflect_bull_researcher(self, current_state, returns_losses, bull_memory):
         """Reflect on bull researcher's analysis and update memory."""
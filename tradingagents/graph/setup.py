@@ -5,7 +5,9 @@ from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
 
-from tradingagents.agents import *
+# Factories are looked up on the package when the graph is built, so importing
+# this module does not load every agent submodule
+from tradingagents import agents
 from tradingagents.agents.utils.agent_states import AgentState
 from tradingagents.agents.utils.agent_utils import Toolkit
 
@@ -62,96 +64,73 @@ class GraphSetup:
         delete_nodes = {}
         tool_nodes = {}
 
-        if "market" in selected_analysts:
-            analyst_nodes["market"] = create_market_analyst(
+        for analyst_type, factory in vars(agents.analyst_factories).items():
+            if analyst_type not in selected_analysts:
+                continue
+            analyst_nodes[analyst_type] = factory(
                 self.quick_thinking_llm, self.toolkit
             )
-            delete_nodes["market"] = create_msg_delete()
-            tool_nodes["market"] = self.tool_nodes["market"]
+            delete_nodes[analyst_type] = agents.create_msg_delete()
+            # Macroeconomic analyst uses the same tools as the market analyst
+            tool_nodes[analyst_type] = self.tool_nodes[
+                "market" if analyst_type == "macroeconomic" else analyst_type
+            ]
 
-        if "macroeconomic" in selected_analysts:
-            analyst_nodes["macroeconomic"] = create_macroeconomic_analyst(
-                self.quick_thinking_llm, self.toolkit
-            )
-            delete_nodes["macroeconomic"] = create_msg_delete()
-            tool_nodes["macroeconomic"] = self.tool_nodes["market"]  # Use same tools as market analyst
-
-        if "social" in selected_analysts:
-            analyst_nodes["social"] = create_social_media_analyst(
-                self.quick_thinking_llm, self.toolkit
-            )
-            delete_nodes["social"] = create_msg_delete()
-            tool_nodes["social"] = self.tool_nodes["social"]
-
-        if "news" in selected_analysts:
-            analyst_nodes["news"] = create_news_analyst(
-                self.quick_thinking_llm, self.toolkit
-            )
-            delete_nodes["news"] = create_msg_delete()
-            tool_nodes["news"] = self.tool_nodes["news"]
-
-        if "fundamentals" in selected_analysts:
-            analyst_nodes["fundamentals"] = create_fundamentals_analyst(
-                self.quick_thinking_llm, self.toolkit
-            )
-            delete_nodes["fundamentals"] = create_msg_delete()
-            tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
-        
         tool_nodes["riskJudge"] = self.tool_nodes["riskJudge"]
-        delete_nodes["riskJudge"] = create_msg_delete()
+        delete_nodes["riskJudge"] = agents.create_msg_delete()
 
         # Create researcher and manager nodes
         # Changed the models from quick thinking to deep thinking
-        bull_researcher_node = create_bull_researcher(
+        bull_researcher_node = agents.create_bull_researcher(
             self.deep_thinking_llm, self.bull_memory
         )
-        bear_researcher_node = create_bear_researcher(
+        bear_researcher_node = agents.create_bear_researcher(
             self.deep_thinking_llm, self.bear_memory
         )
-        research_manager_node = create_research_manager(
+        research_manager_node = agents.create_research_manager(
             self.deep_thinking_llm, self.invest_judge_memory
         )
         
         # Cross Ex Nodes
         
-        bull_researcher_ask_node = create_bull_researcher_ask(
+        bull_researcher_ask_node = agents.create_bull_researcher_ask(
             self.deep_thinking_llm, self.bull_memory
         )
-        bull_researcher_ans_node = create_bull_researcher_ans(
+        bull_researcher_ans_node = agents.create_bull_researcher_ans(
             self.deep_thinking_llm, self.bull_memory
         )
         
-        bear_researcher_ask_node = create_bear_researcher_ask(
+        bear_researcher_ask_node = agents.create_bear_researcher_ask(
             self.deep_thinking_llm, self.bear_memory
         )
-        bear_researcher_ans_node = create_bear_researcher_ans(
+        bear_researcher_ans_node = agents.create_bear_researcher_ans(
             self.deep_thinking_llm, self.bear_memory
         )
         
-        trader_node = create_trader(self.quick_thinking_llm, self.trader_memory)
+        trader_node = agents.create_trader(self.quick_thinking_llm, self.trader_memory)
 
         # Create risk analysis nodes
-        risky_analyst = create_risky_debator(self.quick_thinking_llm)
+        risky_analyst = agents.create_risky_debator(self.quick_thinking_llm)
 
-        risky_analyst_ask = create_risky_debator_ask(self.quick_thinking_llm)
-        risky_analyst_ans = create_risky_debator_ans(self.quick_thinking_llm)
+        risky_analyst_ask = agents.create_risky_debator_ask(self.quick_thinking_llm)
+        risky_analyst_ans = agents.create_risky_debator_ans(self.quick_thinking_llm)
         
-        neutral_analyst = create_neutral_debator(self.quick_thinking_llm)
-        safe_analyst = create_safe_debator(self.quick_thinking_llm)
+        neutral_analyst = agents.create_neutral_debator(self.quick_thinking_llm)
+        safe_analyst = agents.create_safe_debator(self.quick_thinking_llm)
         
-        safe_analyst_ask = create_safe_debator_ask(self.quick_thinking_llm)
-        safe_analyst_ans = create_safe_debator_ans(self.quick_thinking_llm)
+        safe_analyst_ask = agents.create_safe_debator_ask(self.quick_thinking_llm)
+        safe_analyst_ans = agents.create_safe_debator_ans(self.quick_thinking_llm)
 
-        risk_manager_node = create_risk_manager(
+        risk_manager_node = agents.create_risk_manager(
             self.deep_thinking_llm, self.risk_manager_memory, toolkit=self.toolkit
         )
 
         # Quant options manager and Portfolio optimizer nodes
-        quant_options_manager_node = create_quant_options_manager(
+        quant_options_manager_node = agents.create_quant_options_manager(
             self.deep_thinking_llm, self.portfolio_optimizer_memory, self.toolkit
         )
         
-        portfolio_optimizer_node = create_portfolio_optimizer(
+        portfolio_optimizer_node = agents.create_portfolio_optimizer(
             self.deep_thinking_llm, self.portfolio_optimizer_memory, self.toolkit
         )
 
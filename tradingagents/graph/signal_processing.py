@@ -7,8 +7,13 @@ class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
 
     def __init__(self, quick_thinking_llm: ChatOpenAI):
-        """Initialize with an LLM for processing."""
+        """Initialize with an LLM for processing.
+
+        Extracted decisions are memoized per signal for the life of the
+        processor; caching across runs is left to the llm_cache_path cache.
+        """
         self.quick_thinking_llm = quick_thinking_llm
+        self._cache = {}
 
     def process_signal(self, full_signal: str) -> str:
         """
@@ -20,6 +25,10 @@ class SignalProcessor:
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
+        cached = self._cache.get(full_signal)
+        if cached is not None:
+            return cached
+
         messages = [
             (
                 "system",
@@ -28,4 +37,6 @@ class SignalProcessor:
             ("human", full_signal),
         ]
 
-        return self.quick_thinking_llm.invoke(messages).content
+        decision = self.quick_thinking_llm.invoke(messages).content
+        self._cache[full_signal] = decision
+        return decision
@@ -1,6 +1,7 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
+from functools import lru_cache
 from pathlib import Path
 import json
 from datetime import date, datetime
@@ -9,17 +10,13 @@ from typing import Dict, Any, Tuple, List, Optional
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.rate_limiters import InMemoryRateLimiter
 
 from langgraph.prebuilt import ToolNode
 
-from tradingagents.agents import *
+import tradingagents.agents
+from tradingagents.agents import Toolkit, FinancialSituationMemory
 from tradingagents.default_config import DEFAULT_CONFIG
-from tradingagents.agents.utils.memory import FinancialSituationMemory
-from tradingagents.agents.utils.agent_states import (
-    AgentState,
-    InvestDebateState,
-    RiskDebateState,
-)
 from tradingagents.dataflows.interface import set_config
 
 from .conditional_logic import ConditionalLogic
@@ -33,6 +30,37 @@ from tradingagents.blackboard.utils import create_agent_blackboard
 from tradingagents.blackboard.storage import clear_blackboard
 
 
+@lru_cache(maxsize=None)
+def _get_rate_limiter(requests_per_second: float):
+    """Return the token-bucket limiter shared by every client with this request rate."""
+    return InMemoryRateLimiter(requests_per_second=requests_per_second)
+
+
+@lru_cache(maxsize=None)
+def _get_llm(provider: str, model: str, backend_url: str, requests_per_second: Optional[float] = None):
+    """Return a chat model client, reusing one instance per (provider, model, backend_url, rate)."""
+    # The quick and deep clients draw from one bucket, so concurrent calls in
+    # this process (batched reflections, parallel tool-calling) share one cap
+    rate_limiter = _get_rate_limiter(requests_per_second) if requests_per_second else None
+    if provider.lower() == "openai" or provider == "ollama" or provider == "openrouter":
+        return ChatOpenAI(model=model, base_url=backend_url, rate_limiter=rate_limiter)
+    elif provider.lower() == "anthropic":
+        return ChatAnthropic(model=model, base_url=backend_url, rate_limiter=rate_limiter)
+    elif provider.lower() == "google":
+        return ChatGoogleGenerativeAI(model=model, rate_limiter=rate_limiter)
+    raise ValueError(f"Unsupported LLM provider: {provider}")
+
+
+@lru_cache(maxsize=None)
+def _enable_llm_cache(database_path: str):
+    """Install the process-wide LangChain LLM cache backed by database_path (once per path)."""
+    from langchain_community.cache import SQLiteCache
+    from langchain_core.globals import set_llm_cache
+
+    os.makedirs(os.path.dirname(os.path.abspath(database_path)), exist_ok=True)
+    set_llm_cache(SQLiteCache(database_path=database_path))
+
+
 class TradingAgentsGraph:
     """Main class that orchestrates the trading agents framework with blackboard integration."""
 
@@ -61,18 +89,17 @@ class TradingAgentsGraph:
             exist_ok=True,
         )
 
-        # Initialize LLMs
-        if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
-        elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
-        elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"])
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
+        # Initialize LLMs (clients are shared across graphs with the same settings)
+        provider = self.config["llm_provider"]
+        backend_url = self.config["backend_url"]
+        requests_per_second = self.config.get("llm_requests_per_second")
+        self.deep_thinking_llm = _get_llm(provider, self.config["deep_think_llm"], backend_url, requests_per_second)
+        self.quick_thinking_llm = _get_llm(provider, self.config["quick_think_llm"], backend_url, requests_per_second)
+
+        # Identical prompts (e.g. re-running a backtest over the same dates)
+        # are answered from disk instead of calling the provider again
+        if self.config.get("llm_cache_path"):
+            _enable_llm_cache(self.config["llm_cache_path"])
         
         self.toolkit = Toolkit(config=self.config)
 
@@ -87,6 +114,10 @@ class TradingAgentsGraph:
         # Create tool nodes
         self.tool_nodes = self._create_tool_nodes()
 
+        # Load the agent submodules concurrently before graph setup resolves
+        # the factories; imports that already happened are skipped
+        tradingagents.agents.warmup()
+
         # Initialize components
         self.conditional_logic = ConditionalLogic(
             max_debate_rounds=self.config.get("max_debate_rounds", 1),
@@ -115,6 +146,7 @@ class TradingAgentsGraph:
         self.curr_state = None
         self.ticker = None
         self.log_states_dict = {}  # date to full state dict
+        self._posted_market_report = None  # last market report sent to the blackboard
 
         # Set up the graph
         self.graph = self.graph_setup.setup_graph(selected_analysts)
@@ -230,13 +262,15 @@ class TradingAgentsGraph:
         
         # Store ticker for blackboard context
         self.ticker = ticker
+        self._posted_market_report = None
         
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(ticker, date)
         args = self.propagator.get_graph_args()
         
-        # Stream the analysis with blackboard integration
-        trace = []
+        # Stream the analysis with blackboard integration. Each chunk is a full
+        # state snapshot, so only the latest one is kept rather than the trace
+        final_state = init_agent_state
         for chunk in self.graph.stream(init_agent_state, **args):
             if len(chunk["messages"]) > 0:
                 # Process messages and update blackboard as needed
@@ -244,11 +278,11 @@ class TradingAgentsGraph:
                 if self.debug:
                     chunk["messages"][-1].pretty_print()
             
-            trace.append(chunk)
+            final_state = chunk
         
-        # Get final state and decision
-        final_state = trace[-1] if trace else init_agent_state
+        # Get final decision
         final_decision = self._extract_final_decision(final_state)
+        self.curr_state = final_state
         
         if self.debug:
             print(f"✅ Propagation completed for {ticker}")
@@ -256,19 +290,45 @@ class TradingAgentsGraph:
         
         return final_state, final_decision
 
+    def reflect_and_remember(self, returns_losses):
+        """Reflect on the last propagated decision and update each role's memory.
+
+        All five reflections are requested in one LLM call. If that response
+        cannot be parsed, the per-role reflections are issued as one batch.
+        """
+        reflected = self.reflector.reflect_all(self.curr_state, returns_losses)
+        if reflected is None:
+            reflected = self.reflector.reflect_each(self.curr_state, returns_losses)
+        situation, results = reflected
+
+        memories = {
+            "bull_researcher": self.bull_memory,
+            "bear_researcher": self.bear_memory,
+            "trader": self.trader_memory,
+            "invest_judge": self.invest_judge_memory,
+            "risk_manager": self.risk_manager_memory,
+        }
+        for role, memory in memories.items():
+            memory.add_situations([(situation, results[role])])
+
     def _process_chunk_for_blackboard(self, chunk: Dict[str, Any], ticker: str):
         """Process a chunk of the graph execution and update blackboard accordingly."""
         # This method would process the chunk and ensure relevant information
         # is posted to the blackboard for other agents to access
         # Implementation depends on your specific chunk structure
         
-        # Example: If chunk contains analyst reports, post them to blackboard
-        if "market_report" in chunk and chunk["market_report"]:
+        # Example: If chunk contains analyst reports, post them to blackboard.
+        # Every streamed chunk carries the full state, so the same report
+        # shows up in each chunk after the market analyst; post it only when
+        # it changes instead of appending a copy per graph step.
+        market_report = chunk.get("market_report")
+        if market_report and market_report != self._posted_market_report:
             self.blackboard_agents["analysts"]["market"].post_analysis_report(
                 ticker=ticker,
-                analysis={"report": chunk["market_report"]},
+                analysis={"report": market_report},
                 confidence="Medium"
             )
+            self._posted_market_report = market_report
         
         # Add more chunk processing logic as needed
 
@@ -332,8 +392,9 @@ class TradingAgentsGraph:
         import json
         
         messages = read_messages()
+        encoded = json.dumps(messages, indent=2)
         with open(filename, 'w') as f:
-            json.dump(messages, f, indent=2)
+            f.write(encoded)
         
         if self.debug:
             print(f"📤 Blackboard data exported to {filename}")